@@ -1,7 +1,9 @@
 # Get New tag for a branch
-import argparse
+import atexit
+import functools
 import os
 import re
+import string
 import sys
 import subprocess
 from utils import utils
@@ -10,8 +12,11 @@ sys.dont_write_bytecode = True
 
 logger = utils.get_logger()
 repo=""
+github_output_file = None  # GITHUB_OUTPUT handle shared by set_output calls
 TAG_SEPARATOR = "-"
 SNAPSHOT = "SNAPSHOT"
+BRANCH_NAME_LENGTH = 20  # characters of the branch name kept in a snapshot tag
+BRANCH_SLUG_TABLE = str.maketrans("/", "-")  # branch name -> tag-safe slug
 semverRegex = re.compile(r'^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)$')
 moduleRegex = re.compile(r'(.+)-(\d+\.\d+\.\d+)$')  # Will match any module with semver
 moduleRegexMajorMinor = re.compile(r'(.+)-(\d+\.\d+)$')  # Will match any module with major.minor
@@ -21,16 +26,42 @@ moduleTagRegexMajorMinor = re.compile(
 
 majorVersionRegex = re.compile(r'^(0|[1-9]\d*)$')
 minorVersionRegex = re.compile(r'^(0|[1-9]\d*)\.(0|[1-9]\d*)$')
+versionFileRegex = re.compile(r'^(?:0|[1-9]\d*)(?:\.(?:0|[1-9]\d*)){0,2}$')  # any of major, major.minor, semver
 prefixRegexHyphen = re.compile(r'^([a-zA-z]+)\-([0-9]\d*\.[0-9]\d*\.[0-9]\d*)$') #snapshot-1.2.3
 prefixRegexHyphenMajorMinor = re.compile(r'^([a-zA-z]+)\-([0-9]\d*\.[0-9]\d*)$') #snapshot-1.2
 prefixRegexDot = re.compile(r'^([a-zA-z]+)\.([0-9]\d*\.[0-9]\d*\.[0-9]\d*)$') #R.11.23.0
 prefixRegexPlain = re.compile(r'^([a-zA-z]+)([0-9]\d*\.[0-9]\d*\.[0-9]\d*)$') #v1.1.0
 prefixRegexMajor = re.compile(r'^([a-zA-z]+)([0-9]\d*)$')  # v1, v2 etc.,
 prefixRegexMajorMinor = re.compile(r'^([a-zA-z]+)([0-9]\d*\.[0-9]\d*)$')  # v1.1, v2.2 etc.,
+# The prefix shapes above fused into a single pass, tried in the same order.
+# The named group that matched holds the version part of the tag.
+prefixTagRegex = re.compile(
+    r'^[a-zA-z]+(?:'
+    r'\-(?P<hyphen>[0-9]\d*\.[0-9]\d*\.[0-9]\d*)'
+    r'|\-(?P<hyphen_major_minor>[0-9]\d*\.[0-9]\d*)'
+    r'|\.(?P<dot>[0-9]\d*\.[0-9]\d*\.[0-9]\d*)'
+    r'|(?P<plain>[0-9]\d*\.[0-9]\d*\.[0-9]\d*)'
+    r'|(?P<major>[0-9]\d*)'
+    r'|(?P<major_minor>[0-9]\d*\.[0-9]\d*)'
+    r')$'
+)
 suffixRegexHyphen = re.compile(r'^([0-9]\d*\.[0-9]\d*\.[0-9]\d*)\-([a-zA-z]+)$') #1.2.3-snapshot
 suffixRegexHyphenMajorMinor = re.compile(r'^([0-9]\d*\.[0-9]\d*)\-([a-zA-z]+)$') #1.2-snapshot
-
-MODULE_NAME_PATTERN = r'^[a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9]$'
+digitsRegex = re.compile(r"\d+")  # numeric components used as the tag sort key
+tagVersionRegex = re.compile(r'^\d+\.\d+(?:\.\d+)?$')  # version part of a module tag, 1.2.3 or 1.2
+globCharsRegex = re.compile(r"([\\*?\[])")  # wildmatch metacharacters in ref patterns
+
+# Version part of the tags to look for, by shape of the version file (checked in order)
+TAG_VERSION_PATTERNS = (
+    (majorVersionRegex, r"(\d+)"),
+    (minorVersionRegex, r"(\d+\.\d+)"),
+    (semverRegex, r"(\d+\.\d+\.\d+)"),
+)
+ANY_TAG_VERSION_PATTERN = r"(\d+(\.\d+)*)"
+
+# Module names: alphanumeric at both ends, hyphens, dots and underscores in between
+MODULE_NAME_EDGE_CHARS = frozenset(string.ascii_letters + string.digits)
+MODULE_NAME_CHARS = MODULE_NAME_EDGE_CHARS | frozenset("-._")
 
 def validate_module_name(module):
     """
@@ -45,7 +76,12 @@ def validate_module_name(module):
     if not module:
         raise ValueError("Module name cannot be empty")
         
-    if not re.match(MODULE_NAME_PATTERN, module):
+    if (
+        len(module) < 2
+        or module[0] not in MODULE_NAME_EDGE_CHARS
+        or module[-1] not in MODULE_NAME_EDGE_CHARS
+        or not MODULE_NAME_CHARS.issuperset(module)
+    ):
         raise ValueError(
             "Invalid module name. Only alphanumeric characters, hyphens, dots, and underscores are allowed. "
             "Must start and end with alphanumeric character."
@@ -55,8 +91,121 @@ def get_semver_regex():
     return semverRegex
 
 
+def read_version_file(version_file):
+    """
+    Read the base version from the version file.
+    :param version_file: path to the version file (version.txt or floating_version.txt)
+    :return: the version string with surrounding whitespace removed
+    """
+    with open(version_file, "r") as f:
+        return f.read().strip()
+
+
+def _read_base_version(version_file):
+    """
+    Read the base version, after checking that a version file was given.
+    :param version_file: path to the version file (version.txt or floating_version.txt)
+    :return: the version string with surrounding whitespace removed
+    """
+    if not version_file:
+        raise ValueError("Version file must be provided")
+    return read_version_file(version_file)
+
+
+def _numeric_key(tag):
+    """
+    Sort key ordering tags by the numeric components of their version.
+    :param tag: the tag name
+    :return: a tuple of the integers found in the tag
+    """
+    return tuple(map(int, digitsRegex.findall(tag)))
+
+
+@functools.lru_cache(maxsize=128)
+def _build_tag_filter(pattern, is_prefix, module, version_pattern):
+    """
+    Build the predicate used by get_tags to accept a tag, once per combination of inputs.
+    The regex and literal markers are prepared here so repeated get_tags calls reuse them.
+    :param pattern: the pattern to search for the tags (prefix or suffix)
+    :param is_prefix: boolean indicating if the pattern is a prefix (True) or suffix (False)
+    :param module: module name to be used as a prefix
+    :param version_pattern: the version regex derived from the version file
+    :return: a function taking a tag and returning a truthy value when it matches
+    """
+    if pattern:
+        if is_prefix:
+            prefix_regex = re.compile(rf"{re.escape(pattern)}{version_pattern}$")
+            return lambda tag: tag.startswith(pattern) and prefix_regex.search(tag)
+        hyphenated_suffix = f"-{pattern}"
+        suffix_regex = re.compile(rf"{version_pattern}-{re.escape(pattern)}$")
+        return lambda tag: tag.endswith(hyphenated_suffix) and suffix_regex.search(tag)
+    if module:
+        hyphenated_module = f"{module}-"
+        module_regex = re.compile(rf"{re.escape(module)}-{version_pattern}$")
+        return lambda tag: tag.startswith(hyphenated_module) and module_regex.search(tag)
+    return re.compile(f"{version_pattern}$").match
+
+
+def _escape_ref_glob(value):
+    """
+    Escape wildmatch metacharacters so a prefix, suffix or module is matched literally in a ref pattern.
+    :param value: the literal part of the pattern
+    :return: the escaped value
+    """
+    return globCharsRegex.sub(r"\\\1", value)
+
+
+def _tag_ref_patterns(pattern=None, is_prefix=True, module=None):
+    """
+    Build the for-each-ref patterns that narrow the tag listing down to candidate tags.
+    for-each-ref does not let `*` cross a `/`, so a second pattern covers hierarchical tag names.
+    :param pattern: the pattern to search for the tags (prefix or suffix)
+    :param is_prefix: boolean indicating if the pattern is a prefix (True) or suffix (False)
+    :param module: module name to be used as a prefix
+    :return: a list of ref patterns
+    """
+    if pattern:
+        escaped = _escape_ref_glob(pattern)
+        if is_prefix:
+            return [f"refs/tags/{escaped}*", f"refs/tags/{escaped}*/**"]
+        return [f"refs/tags/**/*-{escaped}"]
+    if module:
+        escaped = _escape_ref_glob(module)
+        return [f"refs/tags/{escaped}-*", f"refs/tags/{escaped}-*/**"]
+    return ["refs/tags/"]
+
+
+def _iter_tags(repo_path=".", ref_patterns=None):
+    """
+    Stream the tag names of the git repo, in version order, as git prints them.
+    :param repo_path: the path to the git repo
+    :param ref_patterns: for-each-ref patterns restricting the tags listed
+    :return: a generator of tag names
+    """
+    # Read raw bytes line by line; git prints refnames as UTF-8 with "\n" line endings,
+    # so text mode's locale lookup and newline translation are not needed
+    with subprocess.Popen(
+        ["git", "for-each-ref", "--format=%(refname:strip=2)", "--sort=v:refname"]
+        + (ref_patterns or ["refs/tags/"]),
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as proc:
+        for line in proc.stdout:
+            yield line.rstrip(b"\n").decode("utf-8", errors="replace")
+    if proc.returncode != 0:
+        # Older git without version sort / strip support in for-each-ref
+        output = subprocess.run(
+            ["git", "tag", "-l", "--sort", "refname"],
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+        )
+        yield from output.stdout.decode("utf-8", errors="replace").strip().split("\n")
+
+
 def get_tags(
-    pattern=None, repo_path=".", version_file=None, is_prefix=True, module=None
+    pattern=None, repo_path=".", version_file=None, is_prefix=True, module=None, version=None,
+    all_tags=None, only_latest=False
 ):
     """
     Get the tags from the git repo matching the specified pattern, version, and module.
@@ -65,6 +214,9 @@ def get_tags(
     :param version_file: path to the version file (version.txt or floating_version.txt)
     :param is_prefix: boolean indicating if the pattern is a prefix (True) or suffix (False)
     :param module: module name to be used as a prefix
+    :param version: contents of the version file, when the caller has already read it
+    :param all_tags: tags already listed by the caller, to filter instead of querying git
+    :param only_latest: return just the highest version tag (as a one element list) instead of sorting them all
     :return: a list of tags
     """
     print("Getting tags from the git repo")
@@ -75,118 +227,93 @@ def get_tags(
     if not version_file:
         raise ValueError("Version file must be provided")
 
-    # Get all tags
-    output = subprocess.run(
-        ["git", "tag", "-l", "--sort", "refname"],
-        cwd=repo_path,
-        stdout=subprocess.PIPE,
-        text=True,
-    )
-    all_tags = output.stdout.strip().split("\n")
+    # Candidate tags come in version order, so the sort below has little left to do
+    if all_tags is None:
+        all_tags = _iter_tags(
+            repo_path=repo_path,
+            ref_patterns=_tag_ref_patterns(pattern=pattern, is_prefix=is_prefix, module=module),
+        )
 
     # Read the version from the file
-    with open(version_file, "r") as f:
-        version = f.read().strip()
+    if version is None:
+        version = read_version_file(version_file)
 
     # Determine the version pattern based on the content of version file
-    if majorVersionRegex.match(version):
-        version_pattern = r"(\d+)"
-    elif minorVersionRegex.match(version):
-        version_pattern = r"(\d+\.\d+)"
-    elif semverRegex.match(version):
-        version_pattern = r"(\d+\.\d+\.\d+)"
-    else:
-        version_pattern = r"(\d+(\.\d+)*)"
-
-    def filter_tag(tag):
-        if pattern:
-            if is_prefix:
-                return tag.startswith(pattern) and re.search(
-                    rf"{re.escape(pattern)}{version_pattern}$", tag
-                )
-            else:
-                return tag.endswith(f"-{pattern}") and re.search(
-                    rf"{version_pattern}-{re.escape(pattern)}$", tag
-                )
-        elif module:
-            return tag.startswith(f"{module}-") and re.search(
-                rf"{module}-{version_pattern}$", tag
-            )
-        else:
-            return re.match(f"{version_pattern}$", tag)
+    version_pattern = next(
+        (tag_pattern for version_regex, tag_pattern in TAG_VERSION_PATTERNS if version_regex.match(version)),
+        ANY_TAG_VERSION_PATTERN,
+    )
 
+    filter_tag = _build_tag_filter(pattern, is_prefix, module, version_pattern)
     filtered_tags = list(filter(filter_tag, all_tags))
-    return sorted(filtered_tags, key=lambda x: [int(n) for n in re.findall(r"\d+", x)])
+    if only_latest:
+        # max keeps the first of equal keys, so scan backwards to pick the tag a stable sort would put last
+        return [max(reversed(filtered_tags), key=_numeric_key)] if filtered_tags else []
+    return sorted(filtered_tags, key=_numeric_key)
 
 
-def increase_version(version, version_file):
+def increase_version(version, version_file, base_version=None):
     # Read the base version from the version file
-    f = open(version_file, "r")
-    base_version = f.read().strip()
-    version = str(version)
+    if base_version is None:
+        base_version = read_version_file(version_file)
+    # Split both versions once; the regexes below only decide the shape of the version file
+    version_parts = str(version).split('.')
     next_tag = ""
-    if re.match(semverRegex, base_version):
+    if semverRegex.match(base_version):
         print("Version pattern follows a semver.. increasing the patch version")
-        version = version.split('.')
-        major_version = version[0]
-        minor_version = version[1]
-       
-        base_major_version = base_version.split('.')[0]
-        base_minor_version = base_version.split('.')[1]
-        base_patch_version = base_version.split('.')[2]
+        major_version = int(version_parts[0])
+        minor_version = int(version_parts[1])
+        base_major_version, base_minor_version, base_patch_version = map(int, base_version.split('.'))
 
-        if (int(base_major_version) > int(major_version)):
-            major_version = str(int(base_major_version))
+        if base_major_version > major_version:
+            major_version = base_major_version
             minor_version = base_minor_version
             patch_version = base_patch_version
-        elif (int(base_major_version) == int(major_version)):
-            try:
-                patch_version = str(int(version[2])+1)
-            except IndexError:
+        elif base_major_version == major_version:
+            if len(version_parts) > 2:
+                patch_version = int(version_parts[2]) + 1
+            else:
                 patch_version = base_patch_version
         else:
             # When base major version is less than current major version,
             # increment the current major version and reset minor/patch
-            major_version = str(int(major_version) + 1)
-            minor_version = "0"
-            patch_version = "0"
+            major_version += 1
+            minor_version = 0
+            patch_version = 0
 
-        next_tag = '.'.join([major_version, minor_version, patch_version])
+        next_tag = f"{major_version}.{minor_version}.{patch_version}"
 
-    elif re.match(minorVersionRegex, base_version):
+    elif minorVersionRegex.match(base_version):
         print("Version pattern follows a minor version.. increasing the minor version")
-        major_version = version.split('.')[0]
-        minor_version = version.split('.')[1]
+        major_version = int(version_parts[0])
+        minor_version = int(version_parts[1])
+        base_major_version, base_minor_version = map(int, base_version.split('.'))
 
-        base_major_version = base_version.split('.')[0]
-        base_minor_version = base_version.split('.')[1]
-
-        if (int(base_major_version) > int(major_version)):
-            major_version = str(int(base_major_version))
+        if base_major_version > major_version:
+            major_version = base_major_version
             minor_version = base_minor_version
-        elif (int(base_major_version) == int(major_version)):
-            minor_version = str(int(minor_version)+1)
+        elif base_major_version == major_version:
+            minor_version += 1
         else:
             logger.error(
                 "Base major version cannot be less than current major version")
 
-        next_tag = '.'.join([major_version, minor_version])
-                
-    elif re.match(majorVersionRegex, base_version):
-        print("Version pattern follows a major version.. increasing the major version")
-        major_version = version.split('.')[0]
+        next_tag = f"{major_version}.{minor_version}"
 
-        base_major_version = base_version.split('.')[0]
+    elif majorVersionRegex.match(base_version):
+        print("Version pattern follows a major version.. increasing the major version")
+        major_version = int(version_parts[0])
+        base_major_version = int(base_version)
 
-        if (int(base_major_version) > int(major_version)):
-            major_version = str(int(base_major_version))
-        elif (int(base_major_version) == int(major_version)):
-            major_version = str(int(major_version)+1)
+        if base_major_version > major_version:
+            major_version = base_major_version
+        elif base_major_version == major_version:
+            major_version += 1
         else:
             logger.error(
                 "Base major version cannot be less than current major version")
 
-        next_tag = major_version
+        next_tag = str(major_version)
 
     else:
         logger.error("Version file is not following the standard")
@@ -222,7 +349,7 @@ def append_snapshot_version(
 
         version = append_prefix_suffix_tag(version=version, prefix=prefix, suffix=suffix)
         if branch:
-            branch = branch.replace("/", "-")[:20]
+            branch = branch[:BRANCH_NAME_LENGTH].translate(BRANCH_SLUG_TABLE)
             version = TAG_SEPARATOR.join([version, branch])
         version = TAG_SEPARATOR.join([version, SNAPSHOT])
     else:
@@ -252,16 +379,17 @@ def append_prefix_suffix_tag(
     return version
 
 
-def get_latest_tag_with_prefix(prefix=None, branch=None, version_file=None, repo_path=None):
-    tags = get_tags(pattern=prefix, is_prefix=True, repo_path=repo_path, version_file=version_file)
+def get_latest_tag_with_prefix(prefix=None, branch=None, version_file=None, repo_path=None, all_tags=None):
+    base_version = _read_base_version(version_file)
+    tags = get_tags(pattern=prefix, is_prefix=True, repo_path=repo_path, version_file=version_file,
+                    version=base_version, all_tags=all_tags, only_latest=True)
     print("Tags with Prefix", tags)
     # tags = repo.git.tag("--list", f"{prefix}*", "--sort", "refname")
     tag = ""
     if not tags:
         # No tags present. Read from the version file and create a base tag
         print("No Tags present... Creating a new tag based on the version file...")
-        f = open(version_file, "r")
-        latest_tag = f.read().strip()
+        latest_tag = base_version
 
     if len(tags) > 0:
        
@@ -269,28 +397,13 @@ def get_latest_tag_with_prefix(prefix=None, branch=None, version_file=None, repo
         print("current tag is ", current_tag)
         set_output("current_tag", current_tag)
         # strip off the prefix and just send the semver to increase the version
-        if re.match(prefixRegexHyphen, current_tag):
-            tagGroup = prefixRegexHyphen.search(current_tag)
-            tag = tagGroup.group(2)
-        elif re.match(prefixRegexHyphenMajorMinor, current_tag):
-            tagGroup = prefixRegexHyphenMajorMinor.search(current_tag)
-            tag = tagGroup.group(2)
-        elif re.match(prefixRegexDot, current_tag):
-            tagGroup = prefixRegexDot.search(current_tag)
-            tag = tagGroup.group(2)
-        elif re.match(prefixRegexPlain, current_tag):
-            tagGroup = prefixRegexPlain.search(current_tag)
-            tag = tagGroup.group(2)
-        elif re.match(prefixRegexMajor, current_tag):
-            tagGroup = prefixRegexMajor.search(current_tag)
-            tag = tagGroup.group(2)
-        elif re.match(prefixRegexMajorMinor, current_tag):
-            tagGroup = prefixRegexMajorMinor.search(current_tag)
-            tag = tagGroup.group(2)
+        tagMatch = prefixTagRegex.match(current_tag)
+        if tagMatch:
+            tag = tagMatch.group(tagMatch.lastgroup)
         else:
             logger.error("Tag doesn't follow available combinations.. Please check the documentation")
 
-        latest_tag = increase_version(tag, version_file)
+        latest_tag = increase_version(tag, version_file, base_version=base_version)
 
     next_tag = "".join([prefix, latest_tag])
     print("latest tag is ", next_tag)
@@ -298,53 +411,48 @@ def get_latest_tag_with_prefix(prefix=None, branch=None, version_file=None, repo
     return next_tag
 
 
-def get_latest_tag_with_module(module=None, branch=None, version_file=None, repo_path=None):
+def get_latest_tag_with_module(module=None, branch=None, version_file=None, repo_path=None, all_tags=None):
     """Get the latest tag for a module"""
     # Validate module name first
     validate_module_name(module)
     
     # Validate version file
     try:
-        with open(version_file, 'r') as f:
-            version_content = f.read().strip()
-            if not version_content:
-                raise ValueError("Empty version file")
-            if not (semverRegex.match(version_content) or 
-                   majorVersionRegex.match(version_content) or 
-                   minorVersionRegex.match(version_content)):
-                raise ValueError("Invalid version format in version file")
+        base_version = read_version_file(version_file)
     except FileNotFoundError:
         raise ValueError(f"Version file not found: {version_file}")
+    if not base_version:
+        raise ValueError("Empty version file")
+    if not versionFileRegex.match(base_version):
+        raise ValueError("Invalid version format in version file")
     
     # Get tags after validation
-    tags = get_tags(module=module, repo_path=repo_path, version_file=version_file)
+    tags = get_tags(module=module, repo_path=repo_path, version_file=version_file, version=base_version,
+                    all_tags=all_tags, only_latest=True)
     
     print("Tags with Module", tags)
     
     if not tags:
         # No tags present. Read from the version file and create a base tag
         print("No Tags present... Creating a new tag based on the version file...")
-        f = open(version_file, "r")
-        latest_tag = f.read().strip()
+        latest_tag = base_version
     
     if len(tags) > 0:
         current_tag = tags[-1]  # Get the latest tag
         print("current tag is ", current_tag)
         set_output("current_tag", current_tag)
         
+        # Validate that the tag actually starts with the module prefix
+        if not current_tag.startswith(f"{module}-"):
+            raise ValueError(f"Could not find module '{module}' in tag: {current_tag}")
+        
         # Extract version part by removing the module prefix
         # This handles both simple modules ("node-1.0.0") and complex ones ("my-node-1.0.0")
-        version_part = current_tag.replace(f"{module}-", "", 1)
-        
-        # Validate that we actually found and removed the module prefix
-        if version_part == current_tag:
-            raise ValueError(f"Could not find module '{module}' in tag: {current_tag}")
+        version_part = current_tag.removeprefix(f"{module}-")
             
         # Verify the version part matches expected format
-        if re.match(r'^\d+\.\d+\.\d+$', version_part):
-            latest_tag = increase_version(version_part, version_file)
-        elif re.match(r'^\d+\.\d+$', version_part):
-            latest_tag = increase_version(version_part, version_file)
+        if tagVersionRegex.match(version_part):
+            latest_tag = increase_version(version_part, version_file, base_version=base_version)
         else:
             raise ValueError(f"Invalid version format in tag: {current_tag}")
     
@@ -360,33 +468,40 @@ def get_latest_tag_with_suffix(
     branch: str = None,
     is_snapshot: bool = False,
     repo_path=None,
+    all_tags=None,
 ) -> str:
 
     if TAG_SEPARATOR in suffix:
         raise Exception(f"Key word, {TAG_SEPARATOR}, cannot be used for SUFFIX")
 
-    tags = get_tags(pattern=suffix, is_prefix=False, repo_path=repo_path, version_file=version_file)
+    base_version = _read_base_version(version_file)
+    tags = get_tags(pattern=suffix, is_prefix=False, repo_path=repo_path, version_file=version_file,
+                    version=base_version, all_tags=all_tags)
     tag = ""
     current_tag = None
     if not tags:
         # No tags present. Read from the version file and create a base tag
         print("No Tags present... Creating a new tag based on the version file...")
-        f = open(version_file, "r")
-        latest_tag = f.read().strip()
+        latest_tag = base_version
 
     if len(tags) > 0:
         # tags = tags.split("\n")
-        suffix_tags = [tag for tag in tags if tag.endswith("-" + suffix)]
-        remove_snapshot_tags = [tag for tag in suffix_tags if SNAPSHOT not in tag]
-        tags_version_only = [tag.split("-")[0] for tag in remove_snapshot_tags]
-        sorted_tags = sorted(tags_version_only, key=lambda x: [int(i) if i.isdigit() else i for i in x.split('.')])
-        sortedtags_with_suffix = [tag + f"-{suffix}" for tag in sorted_tags]
-        current_tag = sortedtags_with_suffix[-1]
+        # keep the non-snapshot tags for this suffix, as bare versions, in a single pass
+        # slicing off the known "-suffix" is a plain string cut, unlike split() it builds no list
+        hyphenated_suffix = f"-{suffix}"
+        suffix_start = -len(hyphenated_suffix)
+        tags_version_only = [
+            tag[:suffix_start] for tag in tags
+            if tag.endswith(hyphenated_suffix) and SNAPSHOT not in tag
+        ]
+        # only the highest version is needed: one max() pass instead of a full sort;
+        # max keeps the first of equal keys, so scan backwards to pick the tag a stable sort would put last
+        # the suffix is stripped already, just send the semver to increase the version
+        tag = max(reversed(tags_version_only), key=_numeric_key)
+        current_tag = tag + hyphenated_suffix
         print("current tag is ", current_tag)
         set_output("current_tag", current_tag)
-        # strip off the suffix and just send the semver to increase the version
-        tag = current_tag.split("-")[0]
-        latest_tag = increase_version(tag, version_file)
+        latest_tag = increase_version(tag, version_file, base_version=base_version)
 
     next_tag = append_snapshot_version(current_tag=current_tag, next_tag=latest_tag, suffix=suffix,
                                        is_snapshot=is_snapshot, branch=branch)
@@ -395,20 +510,21 @@ def get_latest_tag_with_suffix(
     return next_tag
 
 
-def get_latest_tag(version_file: str = None, repo_path=None):
-    tags = get_tags(repo_path=repo_path, version_file=version_file)
+def get_latest_tag(version_file: str = None, repo_path=None, all_tags=None):
+    base_version = _read_base_version(version_file)
+    tags = get_tags(repo_path=repo_path, version_file=version_file, version=base_version, all_tags=all_tags,
+                    only_latest=True)
     print("all tags", tags)
     if not tags:
         # No tags present. Read from the version file and create a base tag
         print("No Tags present... Creating a new tag based on the version file...")
-        f = open(version_file, "r")
-        latest_tag = f.read().strip()
+        latest_tag = base_version
 
     if len(tags) > 0:
         # tagsList = tags.split("\n")
         current_tag = tags[-1]
         set_output("current_tag", current_tag)
-        latest_tag = increase_version(current_tag, version_file)
+        latest_tag = increase_version(current_tag, version_file, base_version=base_version)
 
     next_tag = latest_tag
     print("latest tag is ", next_tag)
@@ -420,8 +536,24 @@ def get_latest_tag(version_file: str = None, repo_path=None):
 
 
 def set_output(name, value):
-    with open(os.environ['GITHUB_OUTPUT'], 'a') as gho:
-        print(f'{name}={value}', file=gho)
+    global github_output_file
+    output_path = os.environ['GITHUB_OUTPUT']
+    # Keep the output file open across calls; reopen only if GITHUB_OUTPUT points elsewhere
+    if github_output_file is None or github_output_file.name != output_path:
+        if github_output_file is not None:
+            github_output_file.close()
+        github_output_file = open(output_path, 'a', buffering=1)
+    print(f'{name}={value}', file=github_output_file)
+
+
+def close_output():
+    global github_output_file
+    if github_output_file is not None:
+        github_output_file.close()
+        github_output_file = None
+
+
+atexit.register(close_output)
 
 
 def process(
@@ -431,7 +563,8 @@ def process(
     version_file: str = None,
     module: str = None,
     is_snapshot: bool = False,
-    repo_path: str = None
+    repo_path: str = None,
+    all_tags: list = None
 ) -> str:
     """
     :param prefix: Prefix for the tag (eg., dev, snapshot, beta)
@@ -440,16 +573,18 @@ def process(
     :param version_file: Version reference file to get the base tag.
     :param module: Specify the module to be tagged (eg., a folder inside a repo to be tagged differently)
     :param is_snapshot: if this is True, then create SNAPSHOT tag
+    :param all_tags: tags already listed by the caller, shared across several process() calls
     """
     logger.info(
-        f"""
-        Processing next tag...
-        prefix={prefix}
-        branch={branch}
-        suffix={suffix}
-        version_file={version_file}
-        module={module}
         """
+        Processing next tag...
+        prefix=%s
+        branch=%s
+        suffix=%s
+        version_file=%s
+        module=%s
+        """,
+        prefix, branch, suffix, version_file, module
     )
 
     # Check if the prefix or suffix is SNAPSHOT and not None
@@ -462,7 +597,8 @@ def process(
         next_tag = get_latest_tag_with_prefix(prefix=prefix,
          branch=branch, 
          version_file=version_file, 
-         repo_path=repo_path)
+         repo_path=repo_path,
+         all_tags=all_tags)
     elif suffix != None:
         # Use the suffix to get the latest tag for the pattern
         # Use the suffix to create a new tag.
@@ -471,7 +607,8 @@ def process(
             branch=branch,
             version_file=version_file,
             is_snapshot=is_snapshot,
-            repo_path=repo_path
+            repo_path=repo_path,
+            all_tags=all_tags
         )
     elif module != None:
         # Use module as a prefix to identify the version and increase the module version
@@ -479,20 +616,28 @@ def process(
             module=module, 
             branch=branch, 
             version_file=version_file, 
-            repo_path=repo_path
+            repo_path=repo_path,
+            all_tags=all_tags
         )
     else:
         logger.info("Creating a plain semver tag...")
         next_tag = get_latest_tag(
             version_file=version_file,
-            repo_path=repo_path
+            repo_path=repo_path,
+            all_tags=all_tags
             )
 
     # print("Next Tag from process ", next_tag)
     return next_tag
 
 
-if __name__ == "__main__":
+def main(argv=None) -> int:
+    """
+    :param argv: command line arguments, without the program name (defaults to sys.argv[1:])
+    :return: exit code, 0 on success and 1 if the next tag could not be determined
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Get the next tag for the repo')
     parser.add_argument('-p', '--prefix', dest='prefix', metavar='snapshot',
@@ -510,9 +655,9 @@ if __name__ == "__main__":
     parser.add_argument('-i', '--is-snapshot', dest='is_snapshot',
                         help='Create a SNAPSHOT tag', required=False)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     # repo = utils.get_repo(args.git_repo_path)
-    current_branch = utils.get_repo_branch(args.git_repo_path)
+    current_branch = utils.get_repo_branch(args.git_repo_path or ".")
     print("Current branch is ", current_branch)
     try:
         process(
@@ -526,4 +671,9 @@ if __name__ == "__main__":
         )
     except Exception as exp:
         logger.exception(exp, stack_info=True, exc_info=True)
-        sys.exit(1)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
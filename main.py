@@ -16,7 +16,7 @@ from src.core.tag_manager import TagManager
 from src.core.version_calculator import VersionCalculator
 from src.models.version import VersionConfig, IncrementType
 from src.exceptions import VersionSystemError
-from src.utils.utils import get_logger
+from src.utils.utils import get_logger, read_version_string
 from src.utils.config_loader import ConfigLoader
 from src.utils.security import SecurityValidator
 
@@ -27,7 +27,12 @@ class VersionSystem:
     def __init__(self, repo_path: str, version_file: str, config: Optional[VersionConfig] = None):
         # Validate and secure paths
         self.repo_path = SecurityValidator.validate_directory_path(repo_path)
-        self.version_file = version_file  # Will be validated when used
+        self.version_file = version_file
+        # Validate once; every read of the version file below reuses this path
+        self._safe_version_path = SecurityValidator.validate_file_path(
+            os.path.join(self.repo_path, self.version_file),
+            self.repo_path
+        )
         self.config = config or VersionConfig()
         self.logger = get_logger()
         
@@ -61,19 +66,20 @@ class VersionSystem:
             VersionSystemError: If processing fails
         """
         try:
-            self.logger.info(f"Processing version request: prefix={prefix}, suffix={suffix}, "
-                           f"module={module}, branch={branch}, is_snapshot={is_snapshot}")
+            self.logger.info("Processing version request: prefix=%s, suffix=%s, "
+                             "module=%s, branch=%s, is_snapshot=%s",
+                             prefix, suffix, module, branch, is_snapshot)
             
             # Validate inputs
             self._validate_inputs(prefix, suffix, module)
             
             # Read base version from file
             base_version = self._read_base_version()
-            self.logger.info(f"Base version from file: {base_version}")
+            self.logger.info("Base version from file: %s", base_version)
             
             # Get current version from tags
             current_version = self._get_current_version(prefix, suffix, module)
-            self.logger.info(f"Current version from tags: {current_version}")
+            self.logger.info("Current version from tags: %s", current_version)
             
             # Calculate next version
             next_version = self.version_calculator.calculate_next_version(
@@ -99,7 +105,7 @@ class VersionSystem:
                 )
             
             result = str(next_version)
-            self.logger.info(f"Next version: {result}")
+            self.logger.info("Next version: %s", result)
             
             # Set GitHub outputs
             self._set_github_output("next_tag", result)
@@ -111,7 +117,7 @@ class VersionSystem:
         except VersionSystemError:
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error: {e}")
+            self.logger.error("Unexpected error: %s", e)
             raise VersionSystemError(f"Processing failed: {str(e)}")
     
     def _validate_inputs(self, prefix: Optional[str], suffix: Optional[str], module: Optional[str]):
@@ -137,14 +143,7 @@ class VersionSystem:
     def _read_base_version(self):
         """Read and parse base version from version file"""
         try:
-            # Validate file path for security
-            version_path = SecurityValidator.validate_file_path(
-                os.path.join(self.repo_path, self.version_file), 
-                self.repo_path
-            )
-            
-            with open(version_path, 'r') as f:
-                content = f.read().strip()
+            content = read_version_string(self._safe_version_path)
             
             if not content:
                 raise VersionSystemError("Version file is empty")
@@ -176,36 +175,31 @@ class VersionSystem:
                 default_suffix=self.version_calculator.config.default_suffix
             )
             self.version_calculator.config = new_config
-            self.logger.info(f"Auto-adjusted increment type to 'minor' for major.minor version format")
+            self.logger.info("Auto-adjusted increment type to 'minor' for major.minor version format")
     
     def _get_current_version(self, prefix: Optional[str], suffix: Optional[str], module: Optional[str]):
         """Get current version from git tags"""
         try:
             if module:
-                tags = self.tag_manager.get_tags_for_module(module, 
-                    os.path.join(self.repo_path, self.version_file))
+                tags = self.tag_manager.get_tags_for_module(module, self._safe_version_path)
             elif prefix:
-                tags = self.tag_manager.get_tags_with_prefix(prefix,
-                    os.path.join(self.repo_path, self.version_file))
+                tags = self.tag_manager.get_tags_with_prefix(prefix, self._safe_version_path)
             elif suffix:
                 # Filter out snapshot tags for suffix
-                all_tags = self.tag_manager.get_tags_with_suffix(suffix,
-                    os.path.join(self.repo_path, self.version_file))
+                all_tags = self.tag_manager.get_tags_with_suffix(suffix, self._safe_version_path)
                 tags = [tag for tag in all_tags if 'SNAPSHOT' not in tag.name]
             else:
-                tags = self.tag_manager.get_plain_version_tags(
-                    os.path.join(self.repo_path, self.version_file))
+                tags = self.tag_manager.get_plain_version_tags(self._safe_version_path)
             
             if not tags:
                 self.logger.info("No existing tags found")
                 return None
             
-            # Return the latest version
-            latest_tag = max(tags, key=lambda t: t.version_info)
-            return latest_tag.version_info
+            # Tags come back sorted by version, so the latest is the last one
+            return tags[-1].version_info
             
         except Exception as e:
-            self.logger.warning(f"Failed to get current version from tags: {str(e)}")
+            self.logger.warning("Failed to get current version from tags: %s", e)
             return None
     
     def _set_github_output(self, name: str, value: str):
@@ -216,7 +210,7 @@ class VersionSystem:
                 with open(github_output, 'a') as f:
                     f.write(f'{name}={value}\n')
             except Exception as e:
-                self.logger.warning(f"Failed to set GitHub output {name}: {e}")
+                self.logger.warning("Failed to set GitHub output %s: %s", name, e)
 
 
 def main():
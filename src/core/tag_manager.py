@@ -2,15 +2,38 @@
 Git tag management and operations
 """
 
+import os
+import re
 import subprocess
 import shlex
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+import time
+from typing import Iterator, List, Optional, Dict, Any, Set, Tuple
+from datetime import datetime, timezone
 from ..models.tag import TagInfo, TagPattern, TagPatternRegistry
 from ..models.version import VersionInfo
 from ..exceptions import GitOperationError, TagNotFoundError
 from ..core.version_parser import VersionParser
 from ..utils.security import SecurityValidator
+from ..utils.utils import read_version_string
+
+# Number of version components for each version type
+_VERSION_DEPTHS = {"semver": 3, "major_minor": 2, "major": 1}
+_VERSION_RE = re.compile(r'\d+(?:\.\d+){0,2}')
+
+# Tag name, then commit hash, commit date, author and subject, each once for
+# the tag's own object (lightweight tags) and once peeled (annotated tags)
+_TAG_FORMAT = '%00'.join([
+    '%(refname:strip=2)',
+    '%(objectname)', '%(*objectname)',
+    '%(committerdate:unix)', '%(*committerdate:unix)',
+    '%(authorname)', '%(*authorname)',
+    '%(subject)', '%(*subject)',
+])
+
+
+def _tag_sort_key(tag: TagInfo) -> tuple:
+    """Sort key putting tags in version order, compared as plain tuples"""
+    return tag.version_info._key()
 
 
 class TagManager:
@@ -21,8 +44,25 @@ class TagManager:
         self.version_parser = version_parser or VersionParser()
         self.pattern_registry = TagPatternRegistry()
         self._tag_cache: Optional[List[str]] = None
-        self._cache_timestamp: Optional[datetime] = None
-        self._cache_ttl = timedelta(minutes=5)  # Cache expires after 5 minutes
+        # Commit hash, date, author and subject per tag, fetched with the tag names
+        self._tag_metadata: Dict[str, Tuple[Optional[str], ...]] = {}
+        # Tag names bucketed by (form, prefix/suffix/module, version depth), built with the tag cache
+        self._tag_index: Dict[Tuple[str, str, int], List[str]] = {}
+        self._bucket_cache: Dict[Tuple[str, str, int], List[TagInfo]] = {}
+        # Regexes (pattern, flags) known to match no parseable tag in the cache
+        self._pattern_misses: Set[Tuple[str, int]] = set()
+        # Parsed version per tag name, None for names that don't parse
+        self._parse_cache: Dict[str, Optional[VersionInfo]] = {}
+        # Validated path, mtime when read and version type per requested version file
+        self._version_type_cache: Dict[str, Tuple[str, int, str]] = {}
+        # time.monotonic_ns() value after which the cache is stale
+        self._cache_deadline_ns: Optional[int] = None
+        # Modification times of the tag refs when the cache was filled
+        self._cache_refs_stamp: Optional[Tuple[int, ...]] = None
+        git_dir = os.path.join(repo_path, '.git')
+        self._tag_refs_dir = os.path.join(git_dir, 'refs', 'tags')
+        self._packed_refs_path = os.path.join(git_dir, 'packed-refs')
+        self._cache_ttl_ns = 5 * 60 * 1_000_000_000  # Cache expires after 5 minutes
         
     def get_all_tags(self, force_refresh: bool = False) -> List[str]:
         """
@@ -32,30 +72,55 @@ class TagManager:
             force_refresh: Force refresh of tag cache
             
         Returns:
-            List of tag names sorted by refname
+            List of tag names sorted by refname. The list is the cache itself
+            and must not be modified.
             
         Raises:
             GitOperationError: If git operation fails
         """
-        # Check if cache is expired
+        # Check if cache is expired or the tag refs changed on disk since it was filled
+        refs_stamp = self._refs_stamp()
         cache_expired = (
-            self._cache_timestamp is None or 
-            datetime.now() - self._cache_timestamp > self._cache_ttl
+            self._cache_deadline_ns is None or 
+            time.monotonic_ns() > self._cache_deadline_ns or
+            (refs_stamp is not None and refs_stamp != self._cache_refs_stamp)
         )
         
         if self._tag_cache is None or force_refresh or cache_expired:
             try:
                 result = subprocess.run(
-                    ['git', 'tag', '-l', '--sort=refname'],
+                    ['git', 'for-each-ref', '--sort=refname', f'--format={_TAG_FORMAT}', 'refs/tags'],
                     cwd=self.repo_path,
                     capture_output=True,
-                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
                     timeout=30,
                     check=True
                 )
-                tags = result.stdout.strip().split('\n') if result.stdout.strip() else []
-                self._tag_cache = [tag.strip() for tag in tags if tag.strip()]
-                self._cache_timestamp = datetime.now()
+                tags = []
+                metadata = {}
+                # Split on newlines only: splitlines() would also break subjects
+                # containing characters such as U+2028. Ref names never hold
+                # whitespace, so the name needs no strip.
+                for line in result.stdout.split('\n'):
+                    if not line:
+                        continue
+                    tag_name, *fields = line.split('\x00')
+                    if len(fields) != 8:
+                        continue
+                    tags.append(tag_name)
+                    # Prefer the peeled commit fields of annotated tags
+                    metadata[tag_name] = tuple(
+                        (peeled or direct) or None
+                        for direct, peeled in zip(fields[::2], fields[1::2])
+                    )
+                self._tag_cache = tags
+                self._tag_metadata = metadata
+                self._tag_index = self._build_tag_index(self._tag_cache)
+                self._bucket_cache = {}
+                self._pattern_misses = set()
+                self._cache_deadline_ns = time.monotonic_ns() + self._cache_ttl_ns
+                self._cache_refs_stamp = refs_stamp
             except subprocess.TimeoutExpired:
                 raise GitOperationError("get_all_tags", "Git command timed out")
             except subprocess.CalledProcessError as e:
@@ -63,7 +128,50 @@ class TagManager:
             except Exception as e:
                 raise GitOperationError("get_all_tags", str(e))
         
-        return self._tag_cache.copy()
+        return self._tag_cache
+    
+    def _refs_stamp(self) -> Optional[Tuple[int, ...]]:
+        """
+        Get the modification times of the files and directories git keeps tags in
+        
+        Creating, moving or deleting a tag touches ``packed-refs`` or the
+        ``refs/tags`` directory holding its loose ref; nested tags such as
+        ``release/v-1.0.0`` live in subdirectories, so each of those is stamped
+        too. An unchanged stamp means an unchanged tag list.
+        
+        Returns:
+            Tuple of mtimes in nanoseconds, or None if the git directory
+            isn't a plain ``.git`` folder (worktrees, submodules)
+        """
+        try:
+            mtimes = [os.stat(self._tag_refs_dir).st_mtime_ns]
+        except OSError:
+            return None
+        for dir_path, dir_names, _ in os.walk(self._tag_refs_dir):
+            dir_names.sort()
+            for dir_name in dir_names:
+                try:
+                    mtimes.append(os.stat(os.path.join(dir_path, dir_name)).st_mtime_ns)
+                except OSError:
+                    mtimes.append(0)
+        try:
+            mtimes.append(os.stat(self._packed_refs_path).st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+        return tuple(mtimes)
+    
+    def iter_tags_matching_pattern(self, pattern: TagPattern) -> Iterator[TagInfo]:
+        """
+        Iterate over tags matching a specific pattern, in refname order
+        
+        Args:
+            pattern: TagPattern to match against
+            
+        Yields:
+            TagInfo objects for matching tags
+        """
+        for tag_name, version_info in self._iter_matching_versions(pattern):
+            yield TagInfo(name=tag_name, version_info=version_info)
     
     def get_tags_matching_pattern(self, pattern: TagPattern) -> List[TagInfo]:
         """
@@ -75,20 +183,7 @@ class TagManager:
         Returns:
             List of TagInfo objects for matching tags
         """
-        all_tags = self.get_all_tags()
-        matching_tags = []
-        
-        for tag_name in all_tags:
-            if pattern.matches(tag_name):
-                try:
-                    version_info = self.version_parser.parse(tag_name)
-                    tag_info = TagInfo(name=tag_name, version_info=version_info)
-                    matching_tags.append(tag_info)
-                except Exception:
-                    # Skip tags that can't be parsed
-                    continue
-        
-        return sorted(matching_tags, key=lambda t: t.version_info)
+        return sorted(self.iter_tags_matching_pattern(pattern), key=_tag_sort_key)
     
     def get_latest_tag_for_pattern(self, pattern: TagPattern) -> Optional[TagInfo]:
         """
@@ -100,8 +195,46 @@ class TagManager:
         Returns:
             Latest TagInfo or None if no matches found
         """
-        matching_tags = self.get_tags_matching_pattern(pattern)
-        return matching_tags[-1] if matching_tags else None
+        # Single pass over (name, version) pairs, building only the winning TagInfo;
+        # on equal versions keep the later tag, as the sorted list would
+        latest_name = latest_version = latest_key = None
+        for tag_name, version_info in self._iter_matching_versions(pattern):
+            key = version_info._key()
+            if latest_key is None or not key < latest_key:
+                latest_name, latest_version, latest_key = tag_name, version_info, key
+        
+        if latest_version is None:
+            return None
+        return TagInfo(name=latest_name, version_info=latest_version)
+    
+    def _iter_matching_versions(self, pattern: TagPattern) -> Iterator[Tuple[str, VersionInfo]]:
+        """
+        Iterate over the parsed versions of tags matching a pattern
+        
+        Args:
+            pattern: TagPattern to match against
+            
+        Yields:
+            Tuples of tag name and parsed VersionInfo, in refname order
+        """
+        all_tags = self.get_all_tags()
+        
+        # Skip the scan for a pattern that matched nothing since the cache was filled
+        signature = pattern.source
+        if signature in self._pattern_misses:
+            return
+        
+        found = False
+        for tag_name in all_tags:
+            if pattern.matches(tag_name):
+                version_info = self._parse_tag(tag_name)
+                # Skip tags that can't be parsed
+                if version_info is not None:
+                    found = True
+                    yield tag_name, version_info
+        
+        if not found:
+            self._pattern_misses.add(signature)
     
     def get_tags_for_module(self, module_name: str, version_file: str) -> List[TagInfo]:
         """
@@ -123,15 +256,7 @@ class TagManager:
         # Read version file to determine pattern type
         version_type = self._determine_version_type(version_file)
         
-        # Create appropriate pattern for module
-        if version_type == "semver":
-            pattern = TagPattern.create_semver_pattern(module=module_name)
-        elif version_type == "major_minor":
-            pattern = TagPattern.create_major_minor_pattern(module=module_name)
-        else:
-            pattern = TagPattern.create_major_pattern(module=module_name)
-        
-        tags = self.get_tags_matching_pattern(pattern)
+        tags = self._bucket("lead", module_name, version_type)
         if not tags:
             raise TagNotFoundError(module=module_name)
         
@@ -150,15 +275,7 @@ class TagManager:
         """
         version_type = self._determine_version_type(version_file)
         
-        # Create appropriate pattern for prefix
-        if version_type == "semver":
-            pattern = TagPattern.create_semver_pattern(prefix=prefix)
-        elif version_type == "major_minor":
-            pattern = TagPattern.create_major_minor_pattern(prefix=prefix)
-        else:
-            pattern = TagPattern.create_major_pattern(prefix=prefix)
-        
-        return self.get_tags_matching_pattern(pattern)
+        return self._bucket("lead", prefix, version_type)
     
     def get_tags_with_suffix(self, suffix: str, version_file: str) -> List[TagInfo]:
         """
@@ -173,15 +290,7 @@ class TagManager:
         """
         version_type = self._determine_version_type(version_file)
         
-        # Create appropriate pattern for suffix
-        if version_type == "semver":
-            pattern = TagPattern.create_semver_pattern(suffix=suffix)
-        elif version_type == "major_minor":
-            pattern = TagPattern.create_major_minor_pattern(suffix=suffix)
-        else:
-            pattern = TagPattern.create_major_pattern(suffix=suffix)
-        
-        return self.get_tags_matching_pattern(pattern)
+        return self._bucket("trail", suffix, version_type)
     
     def get_plain_version_tags(self, version_file: str) -> List[TagInfo]:
         """
@@ -195,15 +304,7 @@ class TagManager:
         """
         version_type = self._determine_version_type(version_file)
         
-        # Create appropriate pattern
-        if version_type == "semver":
-            pattern = TagPattern.create_semver_pattern()
-        elif version_type == "major_minor":
-            pattern = TagPattern.create_major_minor_pattern()
-        else:
-            pattern = TagPattern.create_major_pattern()
-        
-        return self.get_tags_matching_pattern(pattern)
+        return self._bucket("plain", "", version_type)
     
     def create_tag(self, tag_name: str, message: str = None) -> bool:
         """
@@ -230,13 +331,18 @@ class TagManager:
                 cmd,
                 cwd=self.repo_path,
                 capture_output=True,
-                text=True,
+                encoding='utf-8',
+                errors='replace',
                 timeout=30,
                 check=True
             )
             
             # Clear cache to force refresh
             self._tag_cache = None
+            self._tag_metadata = {}
+            self._tag_index = {}
+            self._bucket_cache = {}
+            self._pattern_misses = set()
             return True
             
         except subprocess.TimeoutExpired:
@@ -254,8 +360,9 @@ class TagManager:
         Returns:
             True if tag exists
         """
-        all_tags = self.get_all_tags()
-        return tag_name in all_tags
+        self.get_all_tags()
+        # The metadata map holds exactly the cached tag names
+        return tag_name in self._tag_metadata
     
     def get_tag_info(self, tag_name: str) -> Optional[TagInfo]:
         """
@@ -270,50 +377,155 @@ class TagManager:
         if not self.tag_exists(tag_name):
             return None
         
-        try:
-            # Get tag details
-            result = subprocess.run(
-                ['git', 'show', '--format=%H|%ci|%an|%s', '--no-patch', tag_name],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True
-            )
+        return self._build_tag_info(tag_name)
+    
+    def get_tag_infos(self, tag_names: List[str]) -> List[TagInfo]:
+        """
+        Get detailed information about several tags at once
+        
+        All metadata comes from the single git query that fills the tag
+        cache, so this costs no git call per tag.
+        
+        Args:
+            tag_names: Names of the tags
             
-            parts = result.stdout.strip().split('|', 3)
-            commit_hash = parts[0] if len(parts) > 0 else None
-            created_date_str = parts[1] if len(parts) > 1 else None
-            author = parts[2] if len(parts) > 2 else None
-            message = parts[3] if len(parts) > 3 else None
+        Returns:
+            List of TagInfo objects, in the given order, for the tags that
+            exist and can be parsed
+        """
+        self.get_all_tags()
+        tag_infos = []
+        for tag_name in tag_names:
+            if tag_name in self._tag_metadata:
+                tag_info = self._build_tag_info(tag_name)
+                if tag_info is not None:
+                    tag_infos.append(tag_info)
+        return tag_infos
+    
+    def _build_tag_info(self, tag_name: str) -> Optional[TagInfo]:
+        """
+        Build a TagInfo for a cached tag from its fetched metadata
+        
+        Args:
+            tag_name: Name of a tag in the cache
             
-            # Parse date
-            created_date = None
-            if created_date_str:
-                try:
-                    created_date = datetime.fromisoformat(created_date_str.replace(' ', 'T'))
-                except ValueError:
-                    pass
+        Returns:
+            TagInfo object or None if the tag can't be parsed
+        """
+        commit_hash, created_date_str, author, message = self._tag_metadata.get(tag_name, (None,) * 4)
+        
+        # Commit date comes as seconds since the epoch
+        created_date = None
+        if created_date_str:
+            try:
+                created_date = datetime.fromtimestamp(int(created_date_str), tz=timezone.utc)
+            except ValueError:
+                pass
+        
+        # Parse version
+        version_info = self._parse_tag(tag_name)
+        if version_info is None:
+            return None
+        
+        return TagInfo(
+            name=tag_name,
+            version_info=version_info,
+            commit_hash=commit_hash,
+            created_date=created_date,
+            author=author,
+            message=message
+        )
+    
+    def _parse_tag(self, tag_name: str) -> Optional[VersionInfo]:
+        """
+        Parse a tag name, remembering the result for later queries
+        
+        The cached VersionInfo is shared between TagInfo objects and must
+        not be modified.
+        
+        Args:
+            tag_name: Name of the tag
             
-            # Parse version
+        Returns:
+            Parsed VersionInfo or None if the tag can't be parsed
+        """
+        try:
+            return self._parse_cache[tag_name]
+        except KeyError:
+            pass
+        
+        try:
             version_info = self.version_parser.parse(tag_name)
+        except Exception:
+            version_info = None
+        self._parse_cache[tag_name] = version_info
+        return version_info
+    
+    def _build_tag_index(self, tags: List[str]) -> Dict[Tuple[str, str, int], List[str]]:
+        """
+        Bucket tag names by the shapes the tag patterns match
+        
+        A tag is indexed as plain (``1.2.3``), by what leads the version
+        (``prefix-1.2.3`` or ``module-1.2.3``) and by what trails it
+        (``1.2.3-suffix``). Versions never contain a hyphen, so each form
+        has at most one split.
+        
+        Args:
+            tags: Tag names to index
             
-            return TagInfo(
-                name=tag_name,
-                version_info=version_info,
-                commit_hash=commit_hash,
-                created_date=created_date,
-                author=author,
-                message=message
-            )
+        Returns:
+            Mapping of (form, key, version depth) to tag names
+        """
+        index: Dict[Tuple[str, str, int], List[str]] = {}
+        is_version = _VERSION_RE.fullmatch
+        for tag_name in tags:
+            head, _, version = tag_name.rpartition('-')
+            if not head:
+                # Only a tag without a leading part can be a plain version
+                if is_version(tag_name):
+                    index.setdefault(("plain", "", tag_name.count('.') + 1), []).append(tag_name)
+                continue
             
-        except Exception:
-            # Fallback to basic info
-            try:
-                version_info = self.version_parser.parse(tag_name)
-                return TagInfo(name=tag_name, version_info=version_info)
-            except Exception:
-                return None
+            if is_version(version):
+                index.setdefault(("lead", head, version.count('.') + 1), []).append(tag_name)
+            
+            version, _, tail = tag_name.partition('-')
+            if tail and is_version(version):
+                index.setdefault(("trail", tail, version.count('.') + 1), []).append(tag_name)
+        
+        return index
+    
+    def _bucket(self, form: str, key: str, version_type: str) -> List[TagInfo]:
+        """
+        Get the parsed, sorted tags of one index bucket
+        
+        Args:
+            form: 'plain', 'lead' (prefix or module) or 'trail' (suffix)
+            key: The prefix, module or suffix; ignored for plain tags
+            version_type: 'semver', 'major_minor' or 'major'
+            
+        Returns:
+            List of TagInfo objects sorted by version
+        """
+        if not key:
+            form = "plain"
+            key = ""
+        bucket_key = (form, key, _VERSION_DEPTHS.get(version_type, 1))
+        
+        self.get_all_tags()
+        tags = self._bucket_cache.get(bucket_key)
+        if tags is None:
+            parse_tag = self._parse_tag
+            # Skip tags that can't be parsed
+            tags = [
+                TagInfo(name=tag_name, version_info=version_info)
+                for tag_name in self._tag_index.get(bucket_key, ())
+                if (version_info := parse_tag(tag_name)) is not None
+            ]
+            tags.sort(key=_tag_sort_key)
+            self._bucket_cache[bucket_key] = tags
+        
+        return list(tags)
     
     def _determine_version_type(self, version_file: str) -> str:
         """
@@ -326,20 +538,29 @@ class TagManager:
             Version type: 'semver', 'major_minor', or 'major'
         """
         try:
-            # Validate file path for security
-            safe_path = SecurityValidator.validate_file_path(version_file, self.repo_path)
+            # A path validated on an earlier call only needs a stat to reuse its answer
+            cached = self._version_type_cache.get(version_file)
+            if cached is not None:
+                safe_path, cached_mtime, version_type = cached
+                if os.stat(safe_path).st_mtime_ns == cached_mtime:
+                    return version_type
+            else:
+                # Validate file path for security
+                safe_path = SecurityValidator.validate_file_path(version_file, self.repo_path)
             
-            with open(safe_path, 'r') as f:
-                content = f.read().strip()
+            mtime = os.stat(safe_path).st_mtime_ns
+            content = read_version_string(safe_path)
             
+            version_type = "major"
             if '.' in content:
                 parts = content.split('.')
                 if len(parts) >= 3:
-                    return "semver"
+                    version_type = "semver"
                 elif len(parts) == 2:
-                    return "major_minor"
+                    version_type = "major_minor"
             
-            return "major"
+            self._version_type_cache[version_file] = (safe_path, mtime, version_type)
+            return version_type
             
         except Exception:
             # Default to semver if can't read file
@@ -348,8 +569,13 @@ class TagManager:
     def clear_cache(self) -> None:
         """Clear the tag cache"""
         self._tag_cache = None
-        self._cache_timestamp = None
+        self._tag_metadata = {}
+        self._tag_index = {}
+        self._bucket_cache = {}
+        self._pattern_misses = set()
+        self._cache_deadline_ns = None
+        self._cache_refs_stamp = None
     
     def set_cache_ttl(self, ttl_minutes: int) -> None:
         """Set cache time-to-live in minutes"""
-        self._cache_ttl = timedelta(minutes=ttl_minutes)
+        self._cache_ttl_ns = ttl_minutes * 60 * 1_000_000_000
@@ -2,12 +2,17 @@
 Version calculation and increment logic
 """
 
+from dataclasses import replace
 from typing import Optional
 from ..models.version import VersionInfo, IncrementType, VersionType, VersionConfig
 from ..models.tag import TagInfo
 from ..exceptions import InvalidVersionError, ConfigurationError
 
 
+# Branch names use '/' as a separator, which isn't wanted in a version suffix
+_BRANCH_TRANS = str.maketrans({'/': '-'})
+
+
 class VersionCalculator:
     """Handles version calculation and increment operations"""
     
@@ -45,8 +50,9 @@ class VersionCalculator:
             raise InvalidVersionError(str(base_version), "Base version must be a VersionInfo object")
         
         if current_version is None:
-            # No existing versions, use base version
-            return self._normalize_version(base_version)
+            # No existing versions, use base version; return a copy, never the caller's object
+            normalized = self._normalize_version(base_version)
+            return replace(normalized) if normalized is base_version else normalized
         
         # Validate current_version
         if not isinstance(current_version, VersionInfo):
@@ -77,35 +83,10 @@ class VersionCalculator:
         Returns:
             Version to increment
         """
-        # Compare major versions first
-        if base_version.major > current_version.major:
-            # Base version has higher major, use base version
-            return base_version
-        elif base_version.major < current_version.major:
-            # Current version has higher major, increment current
-            return current_version
-        
-        # Major versions are equal, check minor
-        base_minor = base_version.minor or 0
-        current_minor = current_version.minor or 0
-        
-        if base_minor > current_minor:
-            # Base version has higher minor, use base version
-            return base_version
-        elif base_minor < current_minor:
-            # Current version has higher minor, increment current
-            return current_version
-        
-        # Major and minor are equal, check patch
-        base_patch = base_version.patch or 0
-        current_patch = current_version.patch or 0
-        
-        if base_patch > current_patch:
-            # Base version has higher patch, use base version
-            return base_version
-        else:
-            # Current version is >= base patch, increment current
-            return current_version
+        # Compare (major, minor, patch) with missing parts as 0; ties increment current
+        base_key = (base_version.major, base_version.minor or 0, base_version.patch or 0)
+        current_key = (current_version.major, current_version.minor or 0, current_version.patch or 0)
+        return base_version if base_key > current_key else current_version
     
     def _normalize_version(self, version: VersionInfo) -> VersionInfo:
         """
@@ -115,38 +96,48 @@ class VersionCalculator:
             version: Version to normalize
             
         Returns:
-            Normalized version
+            Normalized version, or the given version itself if it already conforms
         """
-        normalized = VersionInfo(
-            major=version.major,
-            minor=version.minor,
-            patch=version.patch,
-            prefix=version.prefix,
-            suffix=version.suffix,
-            module=version.module
-        )
+        if not self._needs_normalization(version):
+            return version
+        
+        config = self.config
         
         # Apply configuration defaults
-        if self.config.default_prefix and not normalized.prefix:
-            normalized.prefix = self.config.default_prefix
-        if self.config.default_suffix and not normalized.suffix:
-            normalized.suffix = self.config.default_suffix
+        prefix = config.default_prefix if config.default_prefix and not version.prefix else version.prefix
+        suffix = config.default_suffix if config.default_suffix and not version.suffix else version.suffix
         
         # Ensure version components match configured type
-        if self.config.version_type == VersionType.MAJOR:
-            normalized.minor = None
-            normalized.patch = None
-        elif self.config.version_type == VersionType.MAJOR_MINOR:
-            normalized.patch = None
-            if normalized.minor is None:
-                normalized.minor = 0
-        elif self.config.version_type == VersionType.SEMVER:
-            if normalized.minor is None:
-                normalized.minor = 0
-            if normalized.patch is None:
-                normalized.patch = 0
-        
-        return normalized
+        minor, patch = version.minor, version.patch
+        if config.version_type == VersionType.MAJOR:
+            minor = patch = None
+        elif config.version_type == VersionType.MAJOR_MINOR:
+            patch = None
+            if minor is None:
+                minor = 0
+        elif config.version_type == VersionType.SEMVER:
+            if minor is None:
+                minor = 0
+            if patch is None:
+                patch = 0
+        
+        return VersionInfo(version.major, minor, patch, prefix, suffix, version.module)
+    
+    def _needs_normalization(self, version: VersionInfo) -> bool:
+        """Check whether _normalize_version would change anything about a version"""
+        config = self.config
+        if config.default_prefix and not version.prefix:
+            return True
+        if config.default_suffix and not version.suffix:
+            return True
+        
+        if config.version_type == VersionType.MAJOR:
+            return version.minor is not None or version.patch is not None
+        if config.version_type == VersionType.MAJOR_MINOR:
+            return version.patch is not None or version.minor is None
+        if config.version_type == VersionType.SEMVER:
+            return version.minor is None or version.patch is None
+        return False
     
     def compare_versions(self, version1: VersionInfo, version2: VersionInfo) -> int:
         """
@@ -159,12 +150,11 @@ class VersionCalculator:
         Returns:
             -1 if version1 < version2, 0 if equal, 1 if version1 > version2
         """
-        if version1 < version2:
-            return -1
-        elif version1 == version2:
-            return 0
-        else:
-            return 1
+        key1, key2 = version1._key(), version2._key()
+        if key1 != key2:
+            return (key1 > key2) - (key1 < key2)
+        # Same position in the ordering; still only 0 for truly equal versions
+        return 0 if version1 == version2 else 1
     
     def is_version_compatible(self, version: VersionInfo, base_version: VersionInfo) -> bool:
         """
@@ -177,27 +167,10 @@ class VersionCalculator:
         Returns:
             True if compatible
         """
-        # Check major version compatibility
-        if version.major < base_version.major:
-            return False
-        
-        # If major versions are equal, check minor
-        if version.major == base_version.major:
-            base_minor = base_version.minor or 0
-            version_minor = version.minor or 0
-            
-            if version_minor < base_minor:
-                return False
-            
-            # If minor versions are equal, check patch
-            if version_minor == base_minor:
-                base_patch = base_version.patch or 0
-                version_patch = version.patch or 0
-                
-                if version_patch < base_patch:
-                    return False
-        
-        return True
+        # Compatible when not older than the base, missing parts counting as 0
+        version_key = (version.major, version.minor or 0, version.patch or 0)
+        base_key = (base_version.major, base_version.minor or 0, base_version.patch or 0)
+        return version_key >= base_key
     
     def create_snapshot_version(
         self, 
@@ -226,7 +199,7 @@ class VersionCalculator:
         # If branch name provided, include it in suffix
         if branch_name:
             # Clean branch name for tag usage
-            clean_branch = branch_name.replace("/", "-")[:20]
+            clean_branch = branch_name[:20].translate(_BRANCH_TRANS)
             snapshot_version.suffix = f"{clean_branch}-SNAPSHOT"
         
         return snapshot_version
@@ -243,19 +216,14 @@ class VersionCalculator:
         """
         suggestions = {}
         
-        try:
+        # Only offer the increments the version has components for, rather than
+        # letting increment() raise for the others
+        if current_version.patch is not None:
             suggestions['patch'] = current_version.increment(IncrementType.PATCH)
-        except ValueError:
-            pass
         
-        try:
+        if current_version.minor is not None:
             suggestions['minor'] = current_version.increment(IncrementType.MINOR)
-        except ValueError:
-            pass
         
-        try:
-            suggestions['major'] = current_version.increment(IncrementType.MAJOR)
-        except ValueError:
-            pass
+        suggestions['major'] = current_version.increment(IncrementType.MAJOR)
         
         return suggestions
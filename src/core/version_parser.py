@@ -2,45 +2,90 @@
 Version parsing and validation utilities
 """
 
+import functools
 import re
-from typing import Optional, List, Dict, Pattern
+from typing import Optional, List, Dict, Pattern, Tuple
 from ..models.version import VersionInfo, VersionType, VersionConfig
 from ..exceptions import InvalidVersionError, ValidationError
 
+# VersionInfo constructor arguments: major, minor, patch, prefix, suffix, module
+VersionFields = Tuple[int, Optional[int], Optional[int], Optional[str], Optional[str], Optional[str]]
+
+
+def _build_patterns() -> Dict[str, Pattern[str]]:
+    """Build regex patterns for version parsing"""
+    return {
+        # Basic version patterns
+        'semver': re.compile(r'^(\d+)\.(\d+)\.(\d+)$'),
+        'major_minor': re.compile(r'^(\d+)\.(\d+)$'),
+        'major': re.compile(r'^(\d+)$'),
+        
+        # Prefixed patterns
+        'prefix_semver': re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)-(\d+)\.(\d+)\.(\d+)$'),
+        'prefix_major_minor': re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)-(\d+)\.(\d+)$'),
+        'prefix_major': re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)-(\d+)$'),
+        
+        # Suffixed patterns
+        'suffix_semver': re.compile(r'^(\d+)\.(\d+)\.(\d+)-([a-zA-Z][a-zA-Z0-9]*)$'),
+        'suffix_major_minor': re.compile(r'^(\d+)\.(\d+)-([a-zA-Z][a-zA-Z0-9]*)$'),
+        'suffix_major': re.compile(r'^(\d+)-([a-zA-Z][a-zA-Z0-9]*)$'),
+        
+        # Module patterns - consistent with validation rules
+        'module_semver': re.compile(r'^([a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9])-(\d+)\.(\d+)\.(\d+)$'),
+        'module_major_minor': re.compile(r'^([a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9])-(\d+)\.(\d+)$'),
+        'module_major': re.compile(r'^([a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9])-(\d+)$'),
+        
+        # Complex patterns (prefix + suffix)
+        'prefix_suffix_semver': re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)-(\d+)\.(\d+)\.(\d+)-([a-zA-Z][a-zA-Z0-9]*)$'),
+    }
+
+
+def _build_unified_pattern(patterns: Dict[str, Pattern[str]]):
+    """
+    Combine the version patterns into one alternation
+    
+    Each pattern becomes a named branch, in the same order, so the regex
+    engine picks the same pattern the sequential loop would have.
+    
+    Args:
+        patterns: Anchored patterns by name, in match order
+    
+    Returns:
+        Tuple of the compiled alternation and, per pattern name, the
+        (start, end) slice of its capture groups in the combined match
+    """
+    branches = []
+    group_spans = {}
+    group_index = 0
+    for pattern_name, pattern in patterns.items():
+        # Strip the anchors; the combined pattern is anchored once
+        branches.append(f'(?P<{pattern_name}>{pattern.pattern[1:-1]})')
+        start = group_index + 1
+        group_index = start + pattern.groups
+        group_spans[pattern_name] = (start, group_index)
+    return re.compile(f'^(?:{"|".join(branches)})$'), group_spans
+
+
+# Compiled once at import and shared by every parser
+_PATTERNS = _build_patterns()
+_UNIFIED_PATTERN, _GROUP_SPANS = _build_unified_pattern(_PATTERNS)
+
+# Module names: alphanumeric start/end, hyphens, dots and underscores in between
+_MODULE_NAME_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9]$')
+
 
 class VersionParser:
     """Handles parsing and validation of version strings"""
     
+    _patterns = _PATTERNS
+    _unified_pattern = _UNIFIED_PATTERN
+    _group_spans = _GROUP_SPANS
+    
     def __init__(self, config: Optional[VersionConfig] = None):
         self.config = config or VersionConfig()
-        self._patterns = self._build_patterns()
-    
-    def _build_patterns(self) -> Dict[str, Pattern[str]]:
-        """Build regex patterns for version parsing"""
-        return {
-            # Basic version patterns
-            'semver': re.compile(r'^(\d+)\.(\d+)\.(\d+)$'),
-            'major_minor': re.compile(r'^(\d+)\.(\d+)$'),
-            'major': re.compile(r'^(\d+)$'),
-            
-            # Prefixed patterns
-            'prefix_semver': re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)-(\d+)\.(\d+)\.(\d+)$'),
-            'prefix_major_minor': re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)-(\d+)\.(\d+)$'),
-            'prefix_major': re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)-(\d+)$'),
-            
-            # Suffixed patterns
-            'suffix_semver': re.compile(r'^(\d+)\.(\d+)\.(\d+)-([a-zA-Z][a-zA-Z0-9]*)$'),
-            'suffix_major_minor': re.compile(r'^(\d+)\.(\d+)-([a-zA-Z][a-zA-Z0-9]*)$'),
-            'suffix_major': re.compile(r'^(\d+)-([a-zA-Z][a-zA-Z0-9]*)$'),
-            
-            # Module patterns - consistent with validation rules
-            'module_semver': re.compile(r'^([a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9])-(\d+)\.(\d+)\.(\d+)$'),
-            'module_major_minor': re.compile(r'^([a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9])-(\d+)\.(\d+)$'),
-            'module_major': re.compile(r'^([a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9])-(\d+)$'),
-            
-            # Complex patterns (prefix + suffix)
-            'prefix_suffix_semver': re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)-(\d+)\.(\d+)\.(\d+)-([a-zA-Z][a-zA-Z0-9]*)$'),
-        }
+        # Parsing depends only on the string, so repeated tags skip the regex work.
+        # Fields are cached rather than VersionInfo objects, which callers may modify.
+        self._parse_fields = functools.lru_cache(maxsize=4096)(self._parse_fields_uncached)
     
     def parse(self, version_string: str) -> VersionInfo:
         """
@@ -58,21 +103,60 @@ class VersionParser:
         if not version_string or not version_string.strip():
             raise InvalidVersionError(version_string, "Version string cannot be empty")
         
-        version_string = version_string.strip()
+        return VersionInfo(*self._parse_fields(version_string.strip()))
+    
+    def _parse_fields_uncached(self, version_string: str) -> VersionFields:
+        """
+        Parse a stripped, non-empty version string into VersionInfo fields
         
-        # Try to match against all patterns
-        for pattern_name, pattern in self._patterns.items():
-            match = pattern.match(version_string)
-            if match:
-                return self._parse_match(match, pattern_name, version_string)
+        Args:
+            version_string: The version string to parse
+            
+        Returns:
+            Tuple of VersionInfo constructor arguments
+            
+        Raises:
+            InvalidVersionError: If the version string is invalid
+        """
+        # Plain numeric versions don't need the regex patterns
+        fields = self._fast_parse_release(version_string)
+        if fields is not None:
+            return fields
+        
+        # The branch that matched names the pattern; its groups follow the branch group
+        match = self._unified_pattern.match(version_string)
+        if match:
+            pattern_name = match.lastgroup
+            start, end = self._group_spans[pattern_name]
+            return self._parse_match(match.groups()[start:end], pattern_name, version_string)
         
         # If no pattern matches, raise an error
         raise InvalidVersionError(version_string, "No valid version pattern found")
     
-    def _parse_match(self, match: re.Match, pattern_name: str, original: str) -> VersionInfo:
-        """Parse a regex match into VersionInfo"""
-        groups = match.groups()
+    def _fast_parse_release(self, version_string: str) -> Optional[VersionFields]:
+        """
+        Parse a plain 'major', 'major.minor' or 'major.minor.patch' string without regex
+        
+        str.isdecimal() accepts exactly the characters the patterns' \\d does.
         
+        Args:
+            version_string: Stripped, non-empty version string
+            
+        Returns:
+            VersionInfo fields, or None if the string isn't a plain numeric version
+        """
+        if not version_string[0].isdecimal():
+            return None
+        
+        parts = version_string.split('.')
+        if len(parts) > 3 or not all(part.isdecimal() for part in parts):
+            return None
+        
+        numbers = [int(part) for part in parts] + [None, None]
+        return numbers[0], numbers[1], numbers[2], None, None, None
+    
+    def _parse_match(self, groups: tuple, pattern_name: str, original: str) -> VersionFields:
+        """Parse the capture groups of a matched pattern into VersionInfo fields"""
         # Initialize version components
         major = minor = patch = None
         prefix = suffix = module = None
@@ -112,14 +196,7 @@ class VersionParser:
         else:
             raise InvalidVersionError(original, f"Unknown pattern: {pattern_name}")
         
-        return VersionInfo(
-            major=major,
-            minor=minor,
-            patch=patch,
-            prefix=prefix,
-            suffix=suffix,
-            module=module
-        )
+        return major, minor, patch, prefix, suffix, module
     
     def validate(self, version_string: str) -> bool:
         """
@@ -131,8 +208,12 @@ class VersionParser:
         Returns:
             True if valid, False otherwise
         """
+        if not version_string or not version_string.strip():
+            return False
+        
+        # Shares parse()'s cache but skips building the VersionInfo
         try:
-            self.parse(version_string)
+            self._parse_fields(version_string.strip())
             return True
         except InvalidVersionError:
             return False
@@ -164,8 +245,7 @@ class VersionParser:
                     "Single character module name must be alphanumeric"
                 )
         else:
-            pattern = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9\-\._]*[a-zA-Z0-9]$')
-            if not pattern.match(module_name):
+            if not _MODULE_NAME_RE.match(module_name):
                 raise ValidationError(
                     "module_name", 
                     module_name, 
@@ -178,6 +258,7 @@ class VersionParser:
             raise ValidationError("module_name", module_name, "Module name too long (max 50 chars)")
         
         # Check for consecutive special characters
+        # Three C-level substring scans beat a single Python-level pass over the name
         if '--' in module_name or '__' in module_name or '..' in module_name:
             raise ValidationError("module_name", module_name, "Consecutive special characters not allowed")
     
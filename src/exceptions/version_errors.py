@@ -26,12 +26,13 @@ class InvalidVersionError(VersionSystemError):
         
         # Add helpful suggestions
         suggestions = []
-        if version and not any(c.isdigit() for c in version):
-            suggestions.append("Version must contain numeric components")
-        if version and '..' in version:
-            suggestions.append("Remove consecutive dots")
-        if version and (version.startswith('-') or version.endswith('-')):
-            suggestions.append("Remove leading/trailing hyphens")
+        if version:
+            if not any(c.isdigit() for c in version):
+                suggestions.append("Version must contain numeric components")
+            if '..' in version:
+                suggestions.append("Remove consecutive dots")
+            if version.startswith('-') or version.endswith('-'):
+                suggestions.append("Remove leading/trailing hyphens")
         
         if suggestions:
             message += f". Suggestions: {'; '.join(suggestions)}"
@@ -3,8 +3,8 @@ Tag data models and utilities
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Optional, Pattern, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Set, Tuple, Union, TYPE_CHECKING
 from datetime import datetime
 import re
 
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from .version import VersionInfo
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TagInfo:
     """Represents a git tag with parsed information"""
     name: str
@@ -30,6 +30,9 @@ class TagInfo:
             return False
         return self.name == other.name
     
+    def __hash__(self) -> int:
+        return hash(self.name)
+    
     def __lt__(self, other) -> bool:
         """Compare tags by version for sorting"""
         if not isinstance(other, TagInfo):
@@ -37,23 +40,82 @@ class TagInfo:
         return self.version_info < other.version_info
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, init=False)
 class TagPattern:
     """Represents a tag pattern for matching and filtering"""
     name: str
-    pattern: Pattern[str]
+    # Regex source and flags; the compiled regex is built on first access
+    pattern_str: str
     prefix: Optional[str] = None
     suffix: Optional[str] = None
     module: Optional[str] = None
     description: Optional[str] = None
+    flags: int = 0
+    _compiled: Optional[Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __init__(self, name: str, pattern: Union[str, Pattern[str], None] = None,
+                 prefix: Optional[str] = None, suffix: Optional[str] = None,
+                 module: Optional[str] = None, description: Optional[str] = None,
+                 *, pattern_str: Optional[str] = None, flags: int = 0):
+        """
+        Args:
+            name: Pattern name
+            pattern: Regex source or compiled regex
+            prefix: Prefix the pattern matches
+            suffix: Suffix the pattern matches
+            module: Module the pattern matches
+            description: Human readable description
+            pattern_str: Regex source, as an alternative to pattern
+            flags: Regex flags used with pattern_str
+        """
+        compiled = None
+        if pattern is None:
+            if pattern_str is None:
+                raise TypeError("TagPattern requires a pattern")
+        elif isinstance(pattern, str):
+            pattern_str = pattern
+        else:
+            # str regexes always carry re.UNICODE unless re.ASCII is set; leave
+            # it out so equal sources compare equal however they were given
+            compiled = pattern
+            pattern_str = pattern.pattern
+            flags = pattern.flags & ~re.UNICODE
+        
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'pattern_str', pattern_str)
+        object.__setattr__(self, 'prefix', prefix)
+        object.__setattr__(self, 'suffix', suffix)
+        object.__setattr__(self, 'module', module)
+        object.__setattr__(self, 'description', description)
+        object.__setattr__(self, 'flags', flags)
+        object.__setattr__(self, '_compiled', compiled)
+    
+    @property
+    def compiled(self) -> Pattern[str]:
+        """The compiled regex, compiling the pattern source on first access"""
+        compiled = self._compiled
+        if compiled is None:
+            compiled = re.compile(self.pattern_str, self.flags)
+            object.__setattr__(self, '_compiled', compiled)
+        return compiled
+    
+    @property
+    def pattern(self) -> Pattern[str]:
+        """The compiled regex (compiled on first access)"""
+        return self.compiled
+    
+    @property
+    def source(self) -> Tuple[str, int]:
+        """Regex source and flags, without compiling the pattern"""
+        return self.pattern_str, self.flags
     
     def matches(self, tag_name: str) -> bool:
         """Check if a tag name matches this pattern"""
-        return bool(self.pattern.match(tag_name))
+        return bool(self.compiled.match(tag_name))
     
     def extract_version(self, tag_name: str) -> Optional[str]:
         """Extract version string from tag name"""
-        match = self.pattern.match(tag_name)
+        match = self.compiled.match(tag_name)
         if not match:
             return None
         
@@ -81,7 +143,7 @@ class TagPattern:
         
         return cls(
             name=name,
-            pattern=re.compile(pattern_str),
+            pattern_str=pattern_str,
             prefix=prefix,
             suffix=suffix,
             module=module,
@@ -108,7 +170,7 @@ class TagPattern:
         
         return cls(
             name=name,
-            pattern=re.compile(pattern_str),
+            pattern_str=pattern_str,
             prefix=prefix,
             suffix=suffix,
             module=module,
@@ -135,7 +197,7 @@ class TagPattern:
         
         return cls(
             name=name,
-            pattern=re.compile(pattern_str),
+            pattern_str=pattern_str,
             prefix=prefix,
             suffix=suffix,
             module=module,
@@ -143,35 +205,156 @@ class TagPattern:
         )
 
 
+# Characters that, right after a literal, make it optional or repeated
+_QUANTIFIERS = ('?', '*', '+', '{')
+
+
+def _anchor_literal(pattern: TagPattern) -> Optional[str]:
+    """
+    Return the '<module>-' or '<prefix>-' literal a pattern's regex is anchored on
+    
+    Only a plain, case-sensitive '^<literal>-...' regex (as built by the create_*
+    factories) qualifies; anything else returns None and is always regex-tested.
+    """
+    source, flags = pattern.source
+    if flags & (re.IGNORECASE | re.VERBOSE) or '|' in source:
+        return None
+    
+    for literal in (pattern.module, pattern.prefix):
+        if not literal:
+            continue
+        anchor = f'^{re.escape(literal)}-'
+        # A quantifier after the '-' (eg., '^v-?') makes the hyphen optional
+        if source.startswith(anchor) and not source.startswith(_QUANTIFIERS, len(anchor)):
+            return f'{literal}-'
+    return None
+
+
+# Backreferences would point at the wrong group once a regex sits inside a combined one
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+# Inline global flags (eg., '(?i)') would apply to every branch of a combined regex on
+# Python < 3.11, and conditionals refer to groups by number
+_INLINE_GROUP_RE = re.compile(r'\(\?[aiLmsux]+\)|\(\?\(')
+
+
+def _combinable(pattern: TagPattern) -> bool:
+    """Check whether a pattern's regex can be embedded as a branch of a combined regex"""
+    source, flags = pattern.source
+    return (flags & ~re.UNICODE == 0 and not _BACKREF_RE.search(source)
+            and not _INLINE_GROUP_RE.search(source) and '(?P<' not in source)
+
+
 class TagPatternRegistry:
     """Registry for managing tag patterns"""
     
     def __init__(self):
-        self.patterns: List[TagPattern] = []
+        # Patterns by name, in insertion order
+        self._by_name: Dict[str, TagPattern] = {}
+        # Literal prefilter: (position, pattern) lists keyed by anchor literal, plus
+        # the patterns without one; rebuilt lazily after the registry changes
+        self._by_literal: Optional[Dict[str, List[Tuple[int, TagPattern]]]] = None
+        self._unanchored: List[Tuple[int, TagPattern]] = []
+        # One alternation of every combinable pattern, with a p<position> group per branch
+        self._combined: Optional[Pattern[str]] = None
+        self._combined_positions: Set[int] = set()
+    
+    @property
+    def patterns(self) -> Tuple[TagPattern, ...]:
+        """
+        Registered patterns, in the order they were added
+        
+        Read-only: a tuple, so list-style mutation (append, remove, clear) fails
+        instead of silently changing a copy. Use add_pattern/remove_pattern/clear.
+        """
+        return tuple(self._by_name.values())
     
     def add_pattern(self, pattern: TagPattern) -> None:
-        """Add a pattern to the registry"""
-        self.patterns.append(pattern)
+        """Add a pattern to the registry, replacing any pattern with the same name"""
+        self._by_name[pattern.name] = pattern
+        self._by_literal = None
     
     def remove_pattern(self, name: str) -> bool:
         """Remove a pattern by name"""
-        for i, pattern in enumerate(self.patterns):
-            if pattern.name == name:
-                del self.patterns[i]
-                return True
-        return False
+        removed = self._by_name.pop(name, None) is not None
+        if removed:
+            self._by_literal = None
+        return removed
     
     def get_pattern(self, name: str) -> Optional[TagPattern]:
         """Get a pattern by name"""
-        for pattern in self.patterns:
-            if pattern.name == name:
-                return pattern
-        return None
+        return self._by_name.get(name)
     
     def find_matching_patterns(self, tag_name: str) -> List[TagPattern]:
         """Find all patterns that match a tag name"""
-        return [pattern for pattern in self.patterns if pattern.matches(tag_name)]
+        by_literal = self._build_index()
+        candidates = list(self._unanchored)
+        
+        # Anchor literals end with '-', so only the tag's prefixes up to each '-' can hit
+        if by_literal:
+            dash = tag_name.find('-')
+            while dash != -1:
+                candidates += by_literal.get(tag_name[:dash + 1], ())
+                dash = tag_name.find('-', dash + 1)
+            candidates.sort(key=lambda entry: entry[0])
+        
+        if not candidates:
+            return []
+        
+        # An alternation tries its branches in order, so a single match of the combined
+        # regex gives the first combinable pattern that matches and rules out all
+        # combinable patterns before it (or all of them, if nothing matches)
+        combined_positions = self._combined_positions
+        first = len(self._by_name)
+        if self._combined is not None:
+            match = self._combined.match(tag_name)
+            if match is not None:
+                first = int(match.lastgroup[1:])
+        
+        matching = []
+        for position, pattern in candidates:
+            if position in combined_positions:
+                if position < first:
+                    continue
+                if position == first:
+                    matching.append(pattern)
+                    continue
+            if pattern.matches(tag_name):
+                matching.append(pattern)
+        return matching
+    
+    def _build_index(self) -> Dict[str, List[Tuple[int, TagPattern]]]:
+        """Build (or return) the literal index and combined regex used by find_matching_patterns"""
+        if self._by_literal is None:
+            by_literal: Dict[str, List[Tuple[int, TagPattern]]] = {}
+            unanchored = []
+            branches = []
+            combined_positions = set()
+            for position, pattern in enumerate(self._by_name.values()):
+                literal = _anchor_literal(pattern)
+                if literal is None:
+                    unanchored.append((position, pattern))
+                else:
+                    by_literal.setdefault(literal, []).append((position, pattern))
+                
+                if _combinable(pattern):
+                    branches.append(f'(?P<p{position}>{pattern.source[0]})')
+                    combined_positions.add(position)
+            
+            combined = None
+            if branches:
+                try:
+                    combined = re.compile('|'.join(branches))
+                except re.error:
+                    # Fall back to matching each pattern on its own
+                    combined_positions = set()
+            
+            self._by_literal = by_literal
+            self._unanchored = unanchored
+            self._combined = combined
+            self._combined_positions = combined_positions
+        return self._by_literal
     
     def clear(self) -> None:
         """Clear all patterns"""
-        self.patterns.clear()
+        self._by_name.clear()
+        self._by_literal = None
@@ -2,6 +2,7 @@
 Version data models and utilities
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional, Tuple
 from enum import Enum
@@ -21,7 +22,7 @@ class IncrementType(Enum):
     PATCH = "patch"
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionInfo:
     """Represents a parsed version"""
     major: int
@@ -31,6 +32,16 @@ class VersionInfo:
     suffix: Optional[str] = None
     module: Optional[str] = None
     
+    def __post_init__(self):
+        # Tags repeat the same few prefixes, suffixes and module names; share one copy
+        # of each so comparing them is usually an identity check
+        if type(self.prefix) is str:
+            self.prefix = sys.intern(self.prefix)
+        if type(self.suffix) is str:
+            self.suffix = sys.intern(self.suffix)
+        if type(self.module) is str:
+            self.module = sys.intern(self.module)
+    
     @property
     def version_type(self) -> VersionType:
         """Determine the version type based on available components"""
@@ -68,35 +79,26 @@ class VersionInfo:
     
     def increment(self, increment_type: IncrementType) -> 'VersionInfo':
         """Create a new VersionInfo with incremented version"""
-        new_version = VersionInfo(
-            major=self.major,
-            minor=self.minor,
-            patch=self.patch,
-            prefix=self.prefix,
-            suffix=self.suffix,
-            module=self.module
-        )
+        major, minor, patch = self.major, self.minor, self.patch
         
         if increment_type == IncrementType.MAJOR:
-            new_version.major += 1
-            if new_version.minor is not None:
-                new_version.minor = 0
-            if new_version.patch is not None:
-                new_version.patch = 0
+            major += 1
+            if minor is not None:
+                minor = 0
+            if patch is not None:
+                patch = 0
         elif increment_type == IncrementType.MINOR:
-            if new_version.minor is not None:
-                new_version.minor += 1
-                if new_version.patch is not None:
-                    new_version.patch = 0
-            else:
+            if minor is None:
                 raise ValueError("Cannot increment minor version for major-only version")
+            minor += 1
+            if patch is not None:
+                patch = 0
         elif increment_type == IncrementType.PATCH:
-            if new_version.patch is not None:
-                new_version.patch += 1
-            else:
+            if patch is None:
                 raise ValueError("Cannot increment patch version for non-semver version")
+            patch += 1
         
-        return new_version
+        return VersionInfo(major, minor, patch, self.prefix, self.suffix, self.module)
     
     def __str__(self) -> str:
         return self.full_version
@@ -124,49 +126,32 @@ class VersionInfo:
             self.module
         ))
     
+    def _key(self) -> Tuple:
+        """
+        Sort key matching the version ordering
+        
+        Versions group by module/prefix, then compare major, minor and patch (missing
+        components count as 0), and finally suffix, where a version without a suffix
+        comes after those with one (e.g., 1.0.0 > 1.0.0-beta).
+        """
+        suffix = self.suffix or ""
+        return (
+            self.module or self.prefix or "",
+            self.major,
+            self.minor or 0,
+            self.patch or 0,
+            not suffix,
+            suffix
+        )
+    
     def __lt__(self, other) -> bool:
         """Compare versions for sorting"""
         if not isinstance(other, VersionInfo):
             return NotImplemented
-        
-        # First compare by module/prefix (for grouping)
-        self_identifier = self.module or self.prefix or ""
-        other_identifier = other.module or other.prefix or ""
-        
-        if self_identifier != other_identifier:
-            return self_identifier < other_identifier
-        
-        # Then compare major version
-        if self.major != other.major:
-            return self.major < other.major
-        
-        # Compare minor version
-        self_minor = self.minor or 0
-        other_minor = other.minor or 0
-        if self_minor != other_minor:
-            return self_minor < other_minor
-        
-        # Compare patch version
-        self_patch = self.patch or 0
-        other_patch = other.patch or 0
-        if self_patch != other_patch:
-            return self_patch < other_patch
-        
-        # Finally compare suffix (for pre-release ordering)
-        self_suffix = self.suffix or ""
-        other_suffix = other.suffix or ""
-        
-        # Handle special case: versions without suffix come after those with suffix
-        # e.g., 1.0.0 > 1.0.0-beta
-        if self_suffix and not other_suffix:
-            return True
-        elif not self_suffix and other_suffix:
-            return False
-        
-        return self_suffix < other_suffix
+        return self._key() < other._key()
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionConfig:
     """Configuration for version parsing and generation"""
     version_type: VersionType = VersionType.SEMVER  # Reverted to original default
@@ -2,13 +2,25 @@
 Configuration loading utilities
 """
 
+import functools
 import yaml
 import os
+from dataclasses import replace
 from typing import Optional, Dict, Any
 from pathlib import Path
 from ..models.version import VersionConfig, VersionType, IncrementType
 from ..exceptions import ConfigurationError
 
+# Use the LibYAML bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# Enum members by config value; only strings can match
+_VERSION_TYPES = {member.value: member for member in VersionType}
+_INCREMENT_TYPES = {member.value: member for member in IncrementType}
+
 
 class ConfigLoader:
     """Handles loading and parsing of configuration files"""
@@ -27,12 +39,38 @@ class ConfigLoader:
         Raises:
             ConfigurationError: If config loading fails
         """
-        if not os.path.exists(config_path):
+        try:
+            stat_result = os.stat(config_path)
+        except (OSError, ValueError):
             raise ConfigurationError("config_file", f"Configuration file not found: {config_path}")
         
+        # Parsed configs are cached per file version; hand out copies since
+        # VersionConfig is mutable
+        config = ConfigLoader._load_cached(
+            os.path.abspath(config_path), stat_result.st_mtime_ns, stat_result.st_size
+        )
+        return replace(config)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_cached(config_path: str, mtime_ns: int, size: int) -> VersionConfig:
+        """
+        Load and parse a configuration file, memoized on its path, mtime and size
+        
+        Args:
+            config_path: Absolute path to configuration file
+            mtime_ns: File modification time, so edits invalidate the cache
+            size: File size, for filesystems with coarse timestamps
+            
+        Returns:
+            VersionConfig object (shared; callers must copy it)
+            
+        Raises:
+            ConfigurationError: If config loading fails
+        """
         try:
             with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=_SafeLoader)
             
             if not config_data:
                 raise ConfigurationError("config_file", "Configuration file is empty")
@@ -53,16 +91,14 @@ class ConfigLoader:
         try:
             # Parse version type
             version_type_str = config_data.get('version_type', 'semver')
-            try:
-                version_type = VersionType(version_type_str)
-            except ValueError:
+            version_type = _VERSION_TYPES.get(version_type_str) if isinstance(version_type_str, str) else None
+            if version_type is None:
                 raise ConfigurationError("version_type", f"Invalid version type: {version_type_str}")
             
             # Parse increment type
             increment_type_str = config_data.get('increment_type', 'patch')
-            try:
-                increment_type = IncrementType(increment_type_str)
-            except ValueError:
+            increment_type = _INCREMENT_TYPES.get(increment_type_str) if isinstance(increment_type_str, str) else None
+            if increment_type is None:
                 raise ConfigurationError("increment_type", f"Invalid increment type: {increment_type_str}")
             
             # Parse other options
@@ -111,6 +147,6 @@ class ConfigLoader:
         
         try:
             with open(config_path, 'w') as f:
-                yaml.dump(default_config, f, default_flow_style=False, indent=2)
+                yaml.dump(default_config, f, Dumper=_SafeDumper, default_flow_style=False, indent=2)
         except Exception as e:
             raise ConfigurationError("config_creation", f"Failed to create config file: {str(e)}")
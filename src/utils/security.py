@@ -3,11 +3,21 @@ Security utilities for safe file operations
 """
 
 import os
+import re
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from ..exceptions import ValidationError
 
 
+# A '..' path component, with either separator
+_TRAVERSAL_RE = re.compile(r'(?:^|[\\/])\.\.(?:[\\/]|$)')
+
+# Characters replaced with '_' by sanitize_filename
+_DANGEROUS_CHARS = '/\\:*?"<>|\0'
+_SANITIZE_TABLE = str.maketrans(_DANGEROUS_CHARS, '_' * len(_DANGEROUS_CHARS))
+
+
 class SecurityValidator:
     """Handles security validation for file operations"""
     
@@ -37,7 +47,7 @@ class SecurityValidator:
             raise ValidationError("file_path", file_path, f"Invalid path format: {str(e)}")
         
         # Check for path traversal attempts
-        if '..' in normalized_path:
+        if _TRAVERSAL_RE.search(normalized_path):
             raise ValidationError("file_path", file_path, "Path traversal not allowed")
         
         # Check for absolute paths outside base_path if specified
@@ -49,11 +59,13 @@ class SecurityValidator:
             except Exception as e:
                 raise ValidationError("base_path", base_path, f"Invalid base path: {str(e)}")
         
-        # Check if path exists and is a file
-        if not os.path.exists(resolved_path):
+        # Check if path exists and is a file, with a single stat call
+        try:
+            mode = os.stat(resolved_path).st_mode
+        except (OSError, ValueError):
             raise ValidationError("file_path", file_path, "File does not exist")
         
-        if not os.path.isfile(resolved_path):
+        if not stat.S_ISREG(mode):
             raise ValidationError("file_path", file_path, "Path is not a file")
         
         return resolved_path
@@ -84,7 +96,7 @@ class SecurityValidator:
             raise ValidationError("dir_path", dir_path, f"Invalid path format: {str(e)}")
         
         # Check for path traversal attempts
-        if '..' in normalized_path:
+        if _TRAVERSAL_RE.search(normalized_path):
             raise ValidationError("dir_path", dir_path, "Path traversal not allowed")
         
         # Check for absolute paths outside base_path if specified
@@ -96,15 +108,53 @@ class SecurityValidator:
             except Exception as e:
                 raise ValidationError("base_path", base_path, f"Invalid base path: {str(e)}")
         
-        # Check if path exists and is a directory
-        if not os.path.exists(resolved_path):
+        # Check if path exists and is a directory, with a single stat call
+        try:
+            mode = os.stat(resolved_path).st_mode
+        except (OSError, ValueError):
             raise ValidationError("dir_path", dir_path, "Directory does not exist")
         
-        if not os.path.isdir(resolved_path):
+        if not stat.S_ISDIR(mode):
             raise ValidationError("dir_path", dir_path, "Path is not a directory")
         
         return resolved_path
     
+    @staticmethod
+    def validate_children(base_path: str, names: Iterable[str]) -> Dict[str, str]:
+        """
+        Validate several subdirectories of one directory in a single scan
+        
+        Prefer this over calling validate_directory_path in a loop: the parent is
+        listed once with os.scandir, whose entries usually know their type without
+        a stat call per directory.
+        
+        Args:
+            base_path: Directory containing the subdirectories
+            names: Subdirectory names (plain names, not paths)
+            
+        Returns:
+            Dictionary mapping each name to its absolute directory path
+            
+        Raises:
+            ValidationError: If base_path is unsafe or any name is not a subdirectory
+        """
+        base_resolved = SecurityValidator.validate_directory_path(base_path)
+        wanted = set(names)
+        
+        found: Dict[str, str] = {}
+        with os.scandir(base_resolved) as entries:
+            for entry in entries:
+                if entry.name in wanted and entry.is_dir():
+                    found[entry.name] = entry.path
+        
+        missing = wanted - found.keys()
+        if missing:
+            raise ValidationError(
+                "dir_path", ", ".join(sorted(missing)), f"Directory does not exist in {base_path}"
+            )
+        
+        return found
+    
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """
@@ -119,15 +169,8 @@ class SecurityValidator:
         if not filename:
             raise ValidationError("filename", filename, "Filename cannot be empty")
         
-        # Remove dangerous characters
-        dangerous_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\0']
-        sanitized = filename
-        
-        for char in dangerous_chars:
-            sanitized = sanitized.replace(char, '_')
-        
-        # Remove leading/trailing dots and spaces
-        sanitized = sanitized.strip('. ')
+        # Replace dangerous characters, then remove leading/trailing dots and spaces
+        sanitized = filename.translate(_SANITIZE_TABLE).strip('. ')
         
         if not sanitized:
             raise ValidationError("filename", filename, "Filename becomes empty after sanitization")
@@ -4,7 +4,16 @@ Utility functions for logging and common operations
 
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional
+
+from ..exceptions import ValidationError
+
+
+# Shared by every handler get_logger creates
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Loggers get_logger has already configured, by name
+_CONFIGURED_LOGGERS: Dict[str, logging.Logger] = {}
 
 
 def get_logger(name: Optional[str] = None, level: int = logging.INFO) -> logging.Logger:
@@ -19,21 +28,51 @@ def get_logger(name: Optional[str] = None, level: int = logging.INFO) -> logging
         Configured logger instance
     """
     logger_name = name or __name__
+    logger = _CONFIGURED_LOGGERS.get(logger_name)
+    if logger is not None:
+        return logger
+    
     logger = logging.getLogger(logger_name)
     
     if not logger.handlers:
         # Create console handler
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(level)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         
         # Add handler to logger
         logger.addHandler(handler)
         logger.setLevel(level)
     
+    _CONFIGURED_LOGGERS[logger_name] = logger
     return logger
+
+
+# A version string is a few bytes; a version file larger than this is rejected unread
+VERSION_FILE_READ_LIMIT = 1024
+
+
+def read_version_string(path: str) -> str:
+    """
+    Read the version string from a version file
+    
+    At most VERSION_FILE_READ_LIMIT + 1 bytes are read, so pointing the
+    version file at a huge file or a device cannot exhaust memory; a file
+    longer than the limit is rejected rather than cut short.
+    
+    Args:
+        path: Path to the version file
+        
+    Returns:
+        File content with surrounding whitespace removed
+        
+    Raises:
+        ValidationError: If the file is larger than VERSION_FILE_READ_LIMIT bytes
+    """
+    with open(path, 'rb') as f:
+        content = f.read(VERSION_FILE_READ_LIMIT + 1)
+    if len(content) > VERSION_FILE_READ_LIMIT:
+        raise ValidationError(
+            "version_file", path, f"file is larger than {VERSION_FILE_READ_LIMIT} bytes"
+        )
+    return content.decode('ascii', errors='replace').strip()
@@ -8,6 +8,11 @@ import sys
 import subprocess
 import tempfile
 
+# Make get_version importable when run as `python3 tests/test_basic.py`
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
 def test_version_file_exists():
     """Test that version.txt exists and is readable"""
     assert os.path.exists("version.txt"), "version.txt should exist"
@@ -25,28 +30,41 @@ def test_get_version_script_exists():
 
 def test_basic_version_generation():
     """Test basic version generation functionality"""
+    import get_version
+
     with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
         f.write("1.0.0")
         temp_version_file = f.name
     
+    previous_output = os.environ.get('GITHUB_OUTPUT')
     try:
         # Set up environment
-        env = os.environ.copy()
-        env['GITHUB_OUTPUT'] = '/tmp/test_output'
+        os.environ['GITHUB_OUTPUT'] = '/tmp/test_output'
         
-        # Run the version generation
-        result = subprocess.run([
-            sys.executable, 'get_version.py',
-            '-f', temp_version_file,
-            '-r', '.'
-        ], capture_output=True, text=True, env=env)
+        # Run the version generation in-process
+        exit_code = get_version.main(['-f', temp_version_file, '-r', '.'])
         
-        assert result.returncode == 0, f"get_version.py failed: {result.stderr}"
+        assert exit_code == 0, "get_version.main failed"
         print("✅ Basic version generation works")
         
     finally:
+        get_version.close_output()
+        if previous_output is None:
+            os.environ.pop('GITHUB_OUTPUT', None)
+        else:
+            os.environ['GITHUB_OUTPUT'] = previous_output
         os.unlink(temp_version_file)
 
+def test_get_version_cli():
+    """Smoke test the get_version.py command line entry point"""
+    result = subprocess.run([
+        sys.executable, 'get_version.py', '--help'
+    ], capture_output=True, text=True)
+    
+    assert result.returncode == 0, f"get_version.py --help failed: {result.stderr}"
+    assert "--version-file" in result.stdout
+    print("✅ get_version.py command line works")
+
 def test_action_yml_exists():
     """Test that action.yml exists and is valid"""
     assert os.path.exists("action.yml"), "action.yml should exist"
@@ -83,6 +101,7 @@ if __name__ == "__main__":
     test_version_file_exists()
     test_get_version_script_exists()
     test_basic_version_generation()
+    test_get_version_cli()
     test_action_yml_exists()
     test_required_files_exist()
     
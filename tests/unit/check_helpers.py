@@ -0,0 +1,12 @@
+import re
+versionKeyRegex = re.compile(r'(\d+)\.(\d+)\.(\d+)(?:-([A-Za-z]+))?')
+
+
+def version_key(tag):
+    # one tuple per tag, compared in C, instead of a split/isdigit list;
+    # tags that are not major.minor.patch sort before every version
+    match = versionKeyRegex.match(tag)
+    if not match:
+        return -1, -1, -1, tag
+    major, minor, patch, suffix = match.groups()
+    return int(major), int(minor), int(patch), suffix or ''
@@ -0,0 +1,8 @@
+import pytest
+from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def version_txt(request):
+    # read once per module from that module's own test_resources directory
+    return (Path(request.module.__file__).parent / "test_resources" / "version.txt").read_text(encoding='utf-8')
@@ -0,0 +1,196 @@
+import os
+import subprocess
+import pytest
+from src.core.tag_manager import TagManager
+from src.exceptions import TagNotFoundError
+from src.models.tag import TagPattern
+
+# Lightweight and annotated tags of every shape the tag patterns look for
+REPO_TAGS = [
+    "1", "2", "1.0", "1.1", "1.0.0", "1.0.1", "1.0.10", "1.0.2",
+    "v-1", "v-1.2", "v-1.2.3", "v-1.10.0", "v-1.9.9", "v1.2.3",
+    "my-app-1.0.0", "my-app-1.2", "my-app-2", "api-3.0.0", "my.lib_x-0.1.0",
+    "1.2.3-rc", "1.2.10-rc", "1.3-rc", "4-rc", "1.2.3-rc-SNAPSHOT", "1.0.0-beta",
+    "v-1.2.3-rc", "release/v-1.0.0", "not-a-version", "1.2.3.4",
+]
+ANNOTATED_TAGS = {"v-1.10.0": "Release v-1.10.0", "1.0.10": "Patch release"}
+
+
+def git(repo, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=Tag Tester", "-c", "user.email=tags@example.com", *args],
+        cwd=repo, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def tag_repo(tmp_path):
+    """A git repo with one commit carrying REPO_TAGS, plus version files of each type"""
+    git(tmp_path, "init", "-q")
+    (tmp_path / "version.txt").write_text("1.0.0\n")
+    (tmp_path / "version_major_minor.txt").write_text("1.0\n")
+    (tmp_path / "version_major.txt").write_text("1\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "Initial commit")
+    for tag in REPO_TAGS:
+        if tag in ANNOTATED_TAGS:
+            git(tmp_path, "tag", "-a", tag, "-m", ANNOTATED_TAGS[tag])
+        else:
+            git(tmp_path, "tag", tag)
+    return tmp_path
+
+
+VERSION_FILES = {
+    "semver": ("version.txt", TagPattern.create_semver_pattern),
+    "major_minor": ("version_major_minor.txt", TagPattern.create_major_minor_pattern),
+    "major": ("version_major.txt", TagPattern.create_major_pattern),
+}
+
+
+def names(tags):
+    return [tag.name for tag in tags]
+
+
+def test_get_all_tags(tag_repo):
+    manager = TagManager(str(tag_repo))
+
+    assert manager.get_all_tags() == sorted(REPO_TAGS)
+
+
+@pytest.mark.parametrize("version_type", sorted(VERSION_FILES))
+@pytest.mark.parametrize("kind, key", [
+    ("prefix", "v"), ("prefix", "release/v"), ("suffix", "rc"), ("suffix", "rc-SNAPSHOT"),
+    ("suffix", "beta"), ("module", "my-app"), ("module", "api"), ("module", "my.lib_x"),
+])
+def test_buckets_match_pattern_scan(tag_repo, version_type, kind, key):
+    """Indexed lookups return the tags a scan with the equivalent TagPattern finds"""
+    version_file, create_pattern = VERSION_FILES[version_type]
+    version_file = str(tag_repo / version_file)
+    manager = TagManager(str(tag_repo))
+
+    expected = names(manager.get_tags_matching_pattern(create_pattern(**{kind: key})))
+    if kind == "prefix":
+        result = manager.get_tags_with_prefix(key, version_file)
+    elif kind == "suffix":
+        result = manager.get_tags_with_suffix(key, version_file)
+    else:
+        try:
+            result = manager.get_tags_for_module(key, version_file)
+        except TagNotFoundError:
+            result = []
+
+    assert names(result) == expected
+
+
+@pytest.mark.parametrize("version_type", sorted(VERSION_FILES))
+def test_plain_bucket_matches_pattern_scan(tag_repo, version_type):
+    version_file, create_pattern = VERSION_FILES[version_type]
+    version_file = str(tag_repo / version_file)
+    manager = TagManager(str(tag_repo))
+
+    expected = names(manager.get_tags_matching_pattern(create_pattern()))
+
+    assert names(manager.get_plain_version_tags(version_file)) == expected
+    assert expected  # the repo has plain tags of every depth
+
+
+def test_latest_tag_for_pattern(tag_repo):
+    manager = TagManager(str(tag_repo))
+    for pattern in [TagPattern.create_semver_pattern(prefix="v"), TagPattern.create_semver_pattern(suffix="rc"),
+                    TagPattern.create_major_pattern(), TagPattern.create_semver_pattern(prefix="nope")]:
+        tags = manager.get_tags_matching_pattern(pattern)
+        latest = manager.get_latest_tag_for_pattern(pattern)
+
+        assert (latest.name if latest else None) == (tags[-1].name if tags else None)
+
+
+def test_tag_metadata(tag_repo):
+    """Lightweight and annotated tags report the tagged commit and its details"""
+    manager = TagManager(str(tag_repo))
+    commit = git(tag_repo, "rev-parse", "HEAD")
+
+    lightweight = manager.get_tag_info("v-1.2.3")
+    annotated = manager.get_tag_info("v-1.10.0")
+
+    for tag_info in (lightweight, annotated):
+        assert tag_info.commit_hash == commit
+        assert tag_info.author == "Tag Tester"
+        assert tag_info.message == "Initial commit"
+        assert tag_info.created_date is not None
+    assert str(annotated.version_info) == "v-1.10.0"
+    assert manager.get_tag_info("not-a-version") is None
+    assert manager.get_tag_info("missing") is None
+
+
+def backdate_tag_refs(repo):
+    """Set an old mtime on the tag ref directories, so any new tag visibly changes it"""
+    for dir_path, _, _ in os.walk(repo / ".git" / "refs" / "tags"):
+        os.utime(dir_path, ns=(0, 0))
+
+
+def test_new_tags_invalidate_cache(tag_repo):
+    """A tag created outside the manager is seen without a forced refresh"""
+    backdate_tag_refs(tag_repo)
+    manager = TagManager(str(tag_repo))
+    assert "v-2.0.0" not in manager.get_all_tags()
+
+    git(tag_repo, "tag", "v-2.0.0")
+
+    assert "v-2.0.0" in manager.get_all_tags()
+    assert names(manager.get_tags_with_prefix("v", str(tag_repo / "version.txt")))[-1] == "v-2.0.0"
+
+
+def test_new_nested_tags_invalidate_cache(tag_repo):
+    """A tag added under an existing refs/tags subdirectory is seen too"""
+    backdate_tag_refs(tag_repo)
+    manager = TagManager(str(tag_repo))
+    assert "release/v-2.0.0" not in manager.get_all_tags()
+
+    git(tag_repo, "tag", "release/v-2.0.0")
+
+    assert "release/v-2.0.0" in manager.get_all_tags()
+
+
+def test_create_tag_invalidates_cache(tag_repo):
+    manager = TagManager(str(tag_repo))
+    manager.get_tags_with_prefix("v", str(tag_repo / "version.txt"))
+
+    manager.create_tag("v-3.0.0")
+
+    assert names(manager.get_tags_with_prefix("v", str(tag_repo / "version.txt")))[-1] == "v-3.0.0"
+    assert manager.tag_exists("v-3.0.0")
+
+
+def test_bucket_results_are_copies(tag_repo):
+    manager = TagManager(str(tag_repo))
+    tags = manager.get_tags_with_prefix("v", str(tag_repo / "version.txt"))
+    tags.clear()
+
+    assert manager.get_tags_with_prefix("v", str(tag_repo / "version.txt"))
+
+
+def test_get_tag_infos(tag_repo):
+    """Bulk lookup agrees with get_tag_info and keeps the requested order"""
+    manager = TagManager(str(tag_repo))
+    requested = ["v-1.10.0", "missing", "1.0.10", "not-a-version", "my-app-1.0.0"]
+
+    tag_infos = manager.get_tag_infos(requested)
+
+    assert names(tag_infos) == ["v-1.10.0", "1.0.10", "my-app-1.0.0"]
+    for tag_info in tag_infos:
+        single = manager.get_tag_info(tag_info.name)
+        assert (tag_info.commit_hash, tag_info.created_date, tag_info.author, tag_info.message) == \
+            (single.commit_hash, single.created_date, single.author, single.message)
+    assert manager.get_tag_infos([]) == []
+
+
+def test_iter_tags_matching_pattern(tag_repo):
+    """The iterator yields the matching tags in refname order, unsorted by version"""
+    manager = TagManager(str(tag_repo))
+    pattern = TagPattern.create_semver_pattern(prefix="v")
+
+    tags = list(manager.iter_tags_matching_pattern(pattern))
+
+    assert names(tags) == ["v-1.10.0", "v-1.2.3", "v-1.9.9"]
+    assert sorted(tags, key=lambda tag: tag.version_info) == manager.get_tags_matching_pattern(pattern)
+    assert list(manager.iter_tags_matching_pattern(TagPattern.create_semver_pattern(prefix="nope"))) == []
@@ -0,0 +1,60 @@
+import pytest
+from src.core.version_parser import VersionParser
+from src.exceptions import InvalidVersionError, ValidationError
+from src.models.version import VersionInfo
+
+VERSION_STRINGS = [
+    "1", "1.2", "1.2.3", "01.002.0003", "  1.2.3\n", "1.2.3.4", "1..2", "1.", ".1", "1.2.",
+    "v-1", "v-1.2", "v-1.2.3", "v1-1.2.3", "1v-1.2.3", "v-1.2.3-rc", "v-1.2.3-rc1",
+    "1-rc", "1.2-rc", "1.2.3-rc", "1.2.3-1rc", "1.2.3-rc-SNAPSHOT",
+    "my-app-1.2.3", "my.app_2-1.2", "my--app-1.2.3", "a__b-1", "x.-1.0.0", "0-1",
+    "١.٢.٣", "1.2.٣", "¹.2.3", "release/v-1.0.0", "v", "-1.2.3", "1.2.3-",
+]
+
+
+def sequential_parse(parser, version_string):
+    """Reference result: try each pattern on its own, in order, as the parser used to"""
+    if not version_string or not version_string.strip():
+        raise InvalidVersionError(version_string, "Version string cannot be empty")
+    version_string = version_string.strip()
+    for pattern_name, pattern in parser._patterns.items():
+        match = pattern.match(version_string)
+        if match:
+            return VersionInfo(*parser._parse_match(match.groups(), pattern_name, version_string))
+    raise InvalidVersionError(version_string, "No valid version pattern found")
+
+
+def outcome(parse, parser, version_string):
+    try:
+        version_info = parse(parser, version_string)
+    except (InvalidVersionError, ValidationError) as error:
+        return type(error)
+    return (version_info.major, version_info.minor, version_info.patch,
+            version_info.prefix, version_info.suffix, version_info.module)
+
+
+@pytest.mark.parametrize("version_string", VERSION_STRINGS)
+def test_parse_matches_sequential_patterns(version_string):
+    """The unified regex and the numeric fast path pick what the pattern loop picks"""
+    parser = VersionParser()
+
+    expected = outcome(sequential_parse, parser, version_string)
+
+    assert outcome(VersionParser.parse, parser, version_string) == expected
+    # A second call is served from the cache and must agree too
+    assert outcome(VersionParser.parse, parser, version_string) == expected
+    # validate() only turns InvalidVersionError into False; bad module names still raise
+    if expected is not ValidationError:
+        assert parser.validate(version_string) == (type(expected) is tuple)
+
+
+def test_parse_returns_independent_objects():
+    """Cached parses hand out fresh VersionInfo objects callers may modify"""
+    parser = VersionParser()
+    first = parser.parse("v-1.2.3")
+    first.prefix = "changed"
+
+    second = parser.parse("v-1.2.3")
+
+    assert second is not first
+    assert second.prefix == "v"
@@ -0,0 +1,33 @@
+import re
+from src.models.tag import TagPattern
+
+
+def test_factory_pattern_is_compiled_on_access():
+    """Factory patterns store the source and compile it the first time it is needed"""
+    pattern = TagPattern.create_semver_pattern(prefix="v")
+
+    assert pattern.pattern_str == r'^v-(\d+\.\d+\.\d+)$'
+    assert pattern._compiled is None
+    assert pattern.pattern.match("v-1.2.3")
+    assert pattern.pattern.pattern == pattern.pattern_str
+    assert pattern.pattern is pattern.compiled
+
+
+def test_source_and_compiled_patterns_compare_equal():
+    """The same regex given as a string or compiled makes equal, equally hashed patterns"""
+    from_source = TagPattern(name="v", pattern=r'^v(\d+)$', prefix="v")
+    from_compiled = TagPattern(name="v", pattern=re.compile(r'^v(\d+)$'), prefix="v")
+
+    assert from_source == from_compiled
+    assert hash(from_source) == hash(from_compiled)
+    assert TagPattern(name="v", pattern=re.compile(r'^v(\d+)$', re.IGNORECASE)) != from_source
+
+
+def test_compiled_pattern_keeps_flags():
+    """A compiled regex passed in is used as is, flags included"""
+    regex = re.compile(r'^V(\d+)$', re.IGNORECASE)
+    pattern = TagPattern(name="v", pattern=regex)
+
+    assert pattern.pattern is regex
+    assert pattern.matches("v1")
+    assert pattern.extract_version("v1") == "1"
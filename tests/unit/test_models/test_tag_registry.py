@@ -0,0 +1,155 @@
+import re
+import pytest
+from src.models.tag import TagPattern, TagPatternRegistry
+
+
+def scan(patterns, tag_name):
+    """Reference result: every pattern tested on its own, in registration order"""
+    return [pattern for pattern in patterns if pattern.matches(tag_name)]
+
+
+@pytest.mark.parametrize("regex", [
+    r'^v-?(\d+\.\d+\.\d+)$',
+    r'^v-*(\d+\.\d+\.\d+)$',
+    r'^v-{0,1}(\d+\.\d+\.\d+)$',
+])
+def test_optional_hyphen_after_prefix(regex):
+    """A quantified hyphen after the prefix is not a required literal"""
+    registry = TagPatternRegistry()
+    pattern = TagPattern(name="x", pattern=re.compile(regex), prefix="v")
+    registry.add_pattern(pattern)
+
+    assert registry.find_matching_patterns("v1.2.3") == [pattern]
+    assert registry.find_matching_patterns("v-1.2.3") == [pattern]
+    assert registry.find_matching_patterns("w1.2.3") == []
+
+
+def test_optional_hyphen_among_factory_patterns():
+    """Anchored and optional-hyphen patterns side by side match like a plain scan"""
+    patterns = [
+        TagPattern.create_semver_pattern(prefix="v"),
+        TagPattern(name="loose-v", pattern=re.compile(r'^v-?(\d+\.\d+\.\d+)$'), prefix="v"),
+        TagPattern(name="verbose-v", pattern=re.compile(r'^v- ? (\d+\.\d+\.\d+)$', re.VERBOSE), prefix="v"),
+        TagPattern.create_semver_pattern(module="v"),
+    ]
+    registry = TagPatternRegistry()
+    for pattern in patterns:
+        registry.add_pattern(pattern)
+
+    for tag_name in ["v1.2.3", "v-1.2.3", "v--1.2.3", "1.2.3"]:
+        assert registry.find_matching_patterns(tag_name) == scan(patterns, tag_name), tag_name
+
+
+def test_patterns_is_read_only():
+    """patterns is a snapshot; mutating it like a list fails loudly"""
+    registry = TagPatternRegistry()
+    pattern = TagPattern.create_semver_pattern(prefix="v")
+    registry.add_pattern(pattern)
+
+    assert registry.patterns == (pattern,)
+    with pytest.raises(AttributeError):
+        registry.patterns.append(TagPattern.create_semver_pattern(prefix="w"))
+    with pytest.raises(AttributeError):
+        registry.patterns.clear()
+    with pytest.raises(AttributeError):
+        registry.patterns = []
+    assert registry.patterns == (pattern,)
+
+
+def mixed_patterns():
+    """Factory patterns plus regexes the prefilter and combined regex must treat specially"""
+    return [
+        TagPattern.create_semver_pattern(prefix="v"),
+        TagPattern.create_major_minor_pattern(prefix="v"),
+        TagPattern.create_semver_pattern(module="my-app"),
+        TagPattern.create_semver_pattern(suffix="rc"),
+        TagPattern.create_semver_pattern(),
+        TagPattern.create_major_pattern(),
+        TagPattern(name="any-v", pattern=r'^v-.*$', prefix="v"),
+        TagPattern(name="ignorecase", pattern=re.compile(r'^V-(\d+)\.(\d+)\.(\d+)$', re.IGNORECASE), prefix="V"),
+        TagPattern(name="backref", pattern=r'^(\d+)\.\1\.(\d+)$'),
+        TagPattern(name="named", pattern=r'^(?P<major>\d+)\.(\d+)\.(\d+)$'),
+        TagPattern(name="either", pattern=r'^(?:v|my-app)-(\d+\.\d+\.\d+)$', prefix="v"),
+        TagPattern(name="unanchored", pattern=r'\d+\.\d+'),
+    ]
+
+
+TAG_NAMES = [
+    "v-1.2.3", "V-1.2.3", "v-1.2", "v-", "my-app-1.2.3", "1.2.3-rc", "1.2.3", "1.1.3",
+    "7", "v-1.2.3-rc", "x1.2", "my-app-", "", "-", "v--1.2.3",
+]
+
+
+@pytest.mark.parametrize("tag_name", TAG_NAMES)
+def test_match_order_follows_registration(tag_name):
+    """Matches come back in registration order, as a plain scan would return them"""
+    patterns = mixed_patterns()
+    registry = TagPatternRegistry()
+    for pattern in patterns:
+        registry.add_pattern(pattern)
+
+    assert registry.find_matching_patterns(tag_name) == scan(patterns, tag_name)
+    # Reversed registration reverses the result
+    registry.clear()
+    for pattern in reversed(patterns):
+        registry.add_pattern(pattern)
+    assert registry.find_matching_patterns(tag_name) == scan(patterns[::-1], tag_name)
+
+
+def test_inline_flags_stay_out_of_combined_regex():
+    """Inline global flags and conditionals match like a plain scan, not across branches"""
+    patterns = [
+        TagPattern(name="x", pattern=r'^x-(\d+)$'),
+        TagPattern(name="inline-i", pattern=r'(?i)^v-(\d+)$'),
+        TagPattern(name="conditional", pattern=r'^(v-)?(?(1)\d+|\d+\.\d+)$'),
+    ]
+    registry = TagPatternRegistry()
+    for pattern in patterns:
+        registry.add_pattern(pattern)
+
+    for tag_name in ["X-1", "x-1", "V-1", "v-1", "v-1.2", "1.2", "1"]:
+        assert registry.find_matching_patterns(tag_name) == scan(patterns, tag_name), tag_name
+    # Only the plain pattern is folded into the combined regex
+    assert registry._combined_positions == {0}
+
+
+def test_same_regex_under_two_names():
+    """Equal regexes registered under different names are both reported"""
+    registry = TagPatternRegistry()
+    first = TagPattern.create_semver_pattern(prefix="v")
+    second = TagPattern(name="also-v", pattern=first.pattern_str, prefix="v")
+    registry.add_pattern(first)
+    registry.add_pattern(second)
+
+    assert registry.find_matching_patterns("v-1.2.3") == [first, second]
+
+
+def test_duplicate_name_replaces_pattern():
+    """Adding a pattern under a registered name replaces it in place"""
+    registry = TagPatternRegistry()
+    old = TagPattern(name="release", pattern=r'^v-(\d+)$')
+    other = TagPattern.create_semver_pattern()
+    new = TagPattern(name="release", pattern=r'^r-(\d+)$')
+    registry.add_pattern(old)
+    registry.add_pattern(other)
+    assert registry.find_matching_patterns("v-1") == [old]
+
+    registry.add_pattern(new)
+
+    assert registry.patterns == (new, other)
+    assert registry.get_pattern("release") is new
+    assert registry.find_matching_patterns("v-1") == []
+    assert registry.find_matching_patterns("r-1") == [new]
+
+
+def test_removed_pattern_no_longer_matches():
+    registry = TagPatternRegistry()
+    pattern = TagPattern.create_semver_pattern(prefix="v")
+    registry.add_pattern(pattern)
+    assert registry.find_matching_patterns("v-1.2.3") == [pattern]
+
+    assert registry.remove_pattern(pattern.name)
+    assert not registry.remove_pattern(pattern.name)
+
+    assert registry.find_matching_patterns("v-1.2.3") == []
+    assert registry.get_pattern(pattern.name) is None
@@ -3,8 +3,10 @@ import os
 from unittest.mock import patch, mock_open
 from get_version import get_latest_tag_with_module, process
 
+TEST_RESOURCES = os.path.join(os.path.dirname(__file__), "test_resources")
+
 def get_version_file_path(filename):
-    return os.path.join(os.path.dirname(__file__), "test_resources", filename)
+    return os.path.join(TEST_RESOURCES, filename)
 
 # Test with semver version file
 @patch("get_version.get_tags")
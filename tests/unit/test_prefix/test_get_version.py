@@ -2,6 +2,12 @@ import pytest
 from unittest.mock import patch
 from get_version import get_latest_tag_with_prefix
 from get_version import get_latest_tag
+from get_version import get_tags
+
+
+def version_tuple(v):
+    # "1.2.3" -> (1, 2, 3), so versions compare numerically
+    return tuple(map(int, v.split('.')))
 
 
 @patch("get_version.get_tags")
@@ -41,16 +47,47 @@ def test_get_latest_tag(mock_set_output):
     
     # The result should be a valid semantic version string
     import re
-    semver_pattern = r'^\d+\.\d+\.\d+$'
-    assert re.match(semver_pattern, result), f"Result '{result}' should be a valid semantic version"
+    semver_pattern = re.compile(r'^\d+\.\d+\.\d+$')
+    assert semver_pattern.match(result), f"Result '{result}' should be a valid semantic version"
     
     # The result should be higher than the base version from file
     with open("version.txt", "r") as f:
         base_version = f.read().strip()
     
-    # Convert versions to tuples for comparison
-    def version_tuple(v):
-        return tuple(map(int, v.split('.')))
-    
     assert version_tuple(result) >= version_tuple(base_version), \
         f"Result version '{result}' should be >= base version '{base_version}'"
+
+
+@patch("get_version._iter_tags")
+def test_get_tags_filters_prefetched_tags(mock_iter_tags):
+    # Tags listed once by the caller are filtered without running git again
+    all_tags = ["v1.0.10", "dev-1.0.0", "v1.0.2", "v1.1", "1.0.0"]
+
+    result = get_tags(pattern="v", version_file="version.txt", all_tags=all_tags)
+
+    mock_iter_tags.assert_not_called()
+    assert result == ["v1.0.2", "v1.0.10"]
+
+
+def test_get_tags_only_latest():
+    # Only the highest version is returned, the same tag the full sort ends with
+    all_tags = ["v1.0.10", "v1.0.2", "v1.0.9", "dev-2.0.0"]
+
+    result = get_tags(pattern="v", version_file="version.txt", all_tags=all_tags, only_latest=True)
+
+    assert result == get_tags(pattern="v", version_file="version.txt", all_tags=all_tags)[-1:]
+    assert result == ["v1.0.10"]
+    assert get_tags(pattern="v", version_file="version.txt", all_tags=["dev-1.0.0"], only_latest=True) == []
+
+
+@patch("get_version._iter_tags")
+def test_get_tags_lists_tags_on_every_call(mock_iter_tags):
+    # Tags created between two lookups are seen by the second one
+    mock_iter_tags.side_effect = [iter(["v1.0.2"]), iter(["v1.0.2", "v1.0.10"])]
+
+    first = get_tags(pattern="v", repo_path=".", version_file="version.txt")
+    second = get_tags(pattern="v", repo_path=".", version_file="version.txt")
+
+    assert mock_iter_tags.call_count == 2
+    assert first == ["v1.0.2"]
+    assert second == ["v1.0.2", "v1.0.10"]
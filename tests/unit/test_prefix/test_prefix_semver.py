@@ -1,4 +1,5 @@
-import os
+import pytest
+from pathlib import Path
 import get_version as get_version
 import sys
 from unittest.mock import patch
@@ -8,20 +9,18 @@ sys.dont_write_bytecode = True
 
 logger = utils.get_logger()
 
+TEST_RESOURCES = Path(__file__).parent / "test_resources"
+
 
 def read_version_file(file_name):
-    pwd = os.path.dirname(__file__)
-    test_resources_path = f"{pwd}/test_resources"
-    result = open(f"{test_resources_path}/{file_name}", 'r').read()
-    return result
-    
+    return (TEST_RESOURCES / file_name).read_text(encoding='utf-8')
+
 
-def test_get_latest_tag_golden_path():
-    version_to_check = read_version_file("version.txt")
-    print(version_to_check)
+def test_get_latest_tag_golden_path(version_txt):
+    print(version_txt)
     prefixRegexHyphen = get_version.prefixRegexHyphen;
     print(prefixRegexHyphen)
-    match = get_version.get_semver_regex().match(version_to_check)
+    match = get_version.get_semver_regex().match(version_txt)
     assert match is None
 
 
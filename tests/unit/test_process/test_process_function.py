@@ -3,8 +3,10 @@ import os
 from unittest.mock import patch
 from get_version import process
 
+TEST_RESOURCES = os.path.join(os.path.dirname(__file__), "test_resources")
+
 def get_resource_path(filename):
-    return os.path.join(os.path.dirname(__file__), "test_resources", filename)
+    return os.path.join(TEST_RESOURCES, filename)
 
 @patch.dict(os.environ, {'GITHUB_OUTPUT': 'github_output.txt'})
 @patch("get_version.get_tags")
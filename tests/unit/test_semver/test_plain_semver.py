@@ -1,5 +1,4 @@
 import pytest
-import os
 from pathlib import Path
 import get_version as get_version
 import re
@@ -11,12 +10,11 @@ sys.dont_write_bytecode = True
 
 logger = utils.get_logger()
 
+TEST_RESOURCES = Path(__file__).parent / "test_resources"
+
 
 def read_version_file(file_name):
-    pwd = os.path.dirname(__file__)
-    test_resources_path = f"{pwd}/test_resources"
-    result = open(f"{test_resources_path}/{file_name}", 'r').read()
-    return result
+    return (TEST_RESOURCES / file_name).read_text(encoding='utf-8')
     
 
 def test_get_latest_tag_golden_path():
@@ -35,7 +33,7 @@ def test_get_latest_tag_fail_prefix():
     print(version_to_check)
     print(get_version.get_semver_regex())
     match = get_version.get_semver_regex().match(version_to_check)
-    logger.info(f"""match regex is {match}""")
+    logger.info("match regex is %s", match)
     
     """
     The semver regex match should return 'None' for all tags 
@@ -52,7 +50,7 @@ def test_get_latest_tag_fail_suffix():
     print(version_to_check)
     print(get_version.get_semver_regex())
     match = get_version.get_semver_regex().match(version_to_check)
-    logger.info(f"""match regex is {match}""")
+    logger.info("match regex is %s", match)
     
     """
     The semver regex match should return 'None' for all tags 
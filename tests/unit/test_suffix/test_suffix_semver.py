@@ -1,5 +1,5 @@
 import get_version as get_version
-import os
+from pathlib import Path
 import pytest
 import sys
 from unittest.mock import patch
@@ -12,40 +12,38 @@ sys.dont_write_bytecode = True
 GIT_TAG_RETURN_VALUE = ["1.6-dev","1.7-dev","3.0-dev","3.1-dev","3.1-dev-SNAPSHOT", "3.2-dev"]
 SUFFIX_VERSION_FILE_PATH = "./tests/unit/test_suffix/test_resources/version.txt"
 
+TEST_RESOURCES = Path(__file__).parent / "test_resources"
+
 
 def read_version_file(file_name):
-    pwd = os.path.dirname(__file__)
-    test_resources_path = f"{pwd}/test_resources"
-    result = open(f"{test_resources_path}/{file_name}", 'r').read()
-    return result
+    return (TEST_RESOURCES / file_name).read_text(encoding='utf-8')
 
 
-def test_get_latest_tag_golden_path():
-    version_to_check = read_version_file("version.txt")
-    print(version_to_check)
+def test_get_latest_tag_golden_path(version_txt):
+    print(version_txt)
     suffixRegexHyphen = get_version.suffixRegexHyphen;
     print(suffixRegexHyphen)
     try:
-        match = suffixRegexHyphen.match(version_to_check)
+        match = suffixRegexHyphen.match(version_txt)
         print(match)
         assert True
     except Exception:
         assert False
 
 
-def test_sort_tag_suffix():
-    version_to_check = read_version_file("version.txt")
+def test_sort_tag_suffix(version_txt):
     suffixRegexHyphen = get_version.suffixRegexHyphen;
     tags = ["1.0.0-dev", "1.0.1-dev", "1.0.10-dev", "1.0.2-dev", "1.0.3-dev", "1.0.4-dev", "1.0.5-dev", "1.0.6-dev", "1.0.7-dev", "1.0.8-dev", "1.0.9-dev"]
     suffix = "dev"
-    tags_without_suffix = [tag.replace(f"-{suffix}", "") for tag in tags]
+    hyphenated_suffix = f"-{suffix}"
+    tags_without_suffix = [tag.removesuffix(hyphenated_suffix) for tag in tags]
     sorted_tags = sorted(tags_without_suffix, key=lambda x: [int(num) if num.isdigit() else num for num in x.split('.')])
-    sortedtags_with_suffix = [tag + f"-{suffix}" for tag in sorted_tags]
+    sortedtags_with_suffix = [tag + hyphenated_suffix for tag in sorted_tags]
     current_tag = sortedtags_with_suffix[-1]
     tag = current_tag.split("-")[0]
     
     try:
-        match = suffixRegexHyphen.match(version_to_check)
+        match = suffixRegexHyphen.match(version_txt)
         print(match)
         assert True
     except Exception:
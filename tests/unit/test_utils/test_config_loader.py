@@ -0,0 +1,76 @@
+import os
+import pytest
+from src.exceptions import ConfigurationError
+from src.models.version import IncrementType, VersionType
+from src.utils.config_loader import ConfigLoader
+
+CONFIG = """version_config:
+  version_type: {version_type}
+  increment_type: {increment_type}
+"""
+
+
+def write_config(path, version_type="semver", increment_type="patch", mtime_ns=None):
+    path.write_text(CONFIG.format(version_type=version_type, increment_type=increment_type))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_config(tmp_path):
+    config_file = tmp_path / "config.yml"
+    write_config(config_file, "major_minor", "minor")
+
+    config = ConfigLoader.load_config(str(config_file))
+
+    assert config.version_type == VersionType.MAJOR_MINOR
+    assert config.increment_type == IncrementType.MINOR
+
+
+def test_edit_with_new_size_is_reloaded(tmp_path):
+    config_file = tmp_path / "config.yml"
+    write_config(config_file, "semver", "patch", mtime_ns=1_000_000_000)
+    assert ConfigLoader.load_config(str(config_file)).version_type == VersionType.SEMVER
+
+    # Same mtime, so only the size tells the versions apart
+    write_config(config_file, "major", "patch", mtime_ns=1_000_000_000)
+
+    assert ConfigLoader.load_config(str(config_file)).version_type == VersionType.MAJOR
+
+
+def test_edit_with_same_size_is_reloaded(tmp_path):
+    config_file = tmp_path / "config.yml"
+    write_config(config_file, "semver", "patch", mtime_ns=1_000_000_000)
+    assert ConfigLoader.load_config(str(config_file)).increment_type == IncrementType.PATCH
+
+    write_config(config_file, "semver", "major", mtime_ns=2_000_000_000)
+
+    assert ConfigLoader.load_config(str(config_file)).increment_type == IncrementType.MAJOR
+
+
+def test_loaded_configs_are_independent(tmp_path):
+    """Changing a loaded config does not leak into later loads of the same file"""
+    config_file = tmp_path / "config.yml"
+    write_config(config_file)
+    first = ConfigLoader.load_config(str(config_file))
+    first.default_prefix = "changed"
+
+    second = ConfigLoader.load_config(str(config_file))
+
+    assert second is not first
+    assert second.default_prefix is None
+
+
+def test_errors_are_not_cached(tmp_path):
+    config_file = tmp_path / "config.yml"
+    write_config(config_file, "bogus", mtime_ns=1_000_000_000)
+    with pytest.raises(ConfigurationError):
+        ConfigLoader.load_config(str(config_file))
+
+    write_config(config_file, "major", mtime_ns=2_000_000_000)
+
+    assert ConfigLoader.load_config(str(config_file)).version_type == VersionType.MAJOR
+
+
+def test_missing_config_file(tmp_path):
+    with pytest.raises(ConfigurationError):
+        ConfigLoader.load_config(str(tmp_path / "missing.yml"))
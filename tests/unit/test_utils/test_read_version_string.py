@@ -0,0 +1,27 @@
+import pytest
+from src.exceptions import ValidationError
+from src.utils.utils import VERSION_FILE_READ_LIMIT, read_version_string
+
+
+def test_read_version_string_strips_whitespace(tmp_path):
+    version_file = tmp_path / "version.txt"
+    version_file.write_text("1.2.3\n")
+
+    assert read_version_string(str(version_file)) == "1.2.3"
+
+
+def test_read_version_string_at_limit(tmp_path):
+    version_file = tmp_path / "version.txt"
+    version_file.write_text("1.2.3".ljust(VERSION_FILE_READ_LIMIT))
+
+    assert read_version_string(str(version_file)) == "1.2.3"
+
+
+def test_read_version_string_rejects_oversized_file(tmp_path):
+    """A file past the limit is rejected, not cut down to a valid looking version"""
+    version_file = tmp_path / "version.txt"
+    version_file.write_text("1.2.3".ljust(VERSION_FILE_READ_LIMIT) + "junk")
+
+    with pytest.raises(ValidationError) as exc_info:
+        read_version_string(str(version_file))
+    assert "larger than" in str(exc_info.value)
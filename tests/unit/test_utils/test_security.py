@@ -0,0 +1,46 @@
+import os
+import pytest
+from src.exceptions import ValidationError
+from src.utils.security import SecurityValidator
+
+
+@pytest.fixture
+def modules_dir(tmp_path):
+    """A directory with two module directories, a symlink to one and a plain file"""
+    (tmp_path / "api").mkdir()
+    (tmp_path / "web").mkdir()
+    (tmp_path / "README.md").write_text("modules")
+    os.symlink(tmp_path / "api", tmp_path / "api-link")
+    return tmp_path
+
+
+def test_validate_children_returns_paths(modules_dir):
+    result = SecurityValidator.validate_children(str(modules_dir), ["api", "web"])
+
+    assert result == {"api": str(modules_dir / "api"), "web": str(modules_dir / "web")}
+    # Same answer as validating each directory on its own
+    for name, path in result.items():
+        assert path == SecurityValidator.validate_directory_path(str(modules_dir / name))
+
+
+def test_validate_children_follows_directory_symlinks(modules_dir):
+    result = SecurityValidator.validate_children(str(modules_dir), ["api-link"])
+
+    assert result == {"api-link": str(modules_dir / "api-link")}
+
+
+def test_validate_children_missing_name(modules_dir):
+    with pytest.raises(ValidationError) as exc_info:
+        SecurityValidator.validate_children(str(modules_dir), ["api", "cli"])
+    assert exc_info.value.details["value"] == "cli"
+
+
+def test_validate_children_rejects_files(modules_dir):
+    with pytest.raises(ValidationError) as exc_info:
+        SecurityValidator.validate_children(str(modules_dir), ["README.md"])
+    assert exc_info.value.details["value"] == "README.md"
+
+
+def test_validate_children_rejects_parent_reference(modules_dir):
+    with pytest.raises(ValidationError):
+        SecurityValidator.validate_children(str(modules_dir / "api"), [".."])
@@ -1,11 +1,13 @@
 import pytest
 import os
 from unittest.mock import patch, mock_open
-from get_version import get_latest_tag_with_module
+from get_version import get_latest_tag, get_latest_tag_with_module, get_latest_tag_with_prefix, get_latest_tag_with_suffix
+
+TEST_RESOURCES = os.path.join(os.path.dirname(__file__), "test_resources")
 
 def get_resource_path(filename):
     """Helper function to get path to test resource files"""
-    return os.path.join(os.path.dirname(__file__), "test_resources", filename)
+    return os.path.join(TEST_RESOURCES, filename)
 
 def read_version_file(filename):
     """Helper function to read test resource files"""
@@ -55,4 +57,16 @@ def test_no_tags_found(mock_get_tags):
             module="test",
             version_file="version.txt"
         )
-    assert result == "test-1.0.0" 
\ No newline at end of file
+    assert result == "test-1.0.0"
+
+
+@pytest.mark.parametrize("lookup", [
+    lambda: get_latest_tag(version_file=None),
+    lambda: get_latest_tag_with_prefix(prefix="v", version_file=None),
+    lambda: get_latest_tag_with_suffix(suffix="rc", version_file=None),
+])
+def test_missing_version_file_argument(lookup):
+    """Test that a missing version file argument is reported before any file is read"""
+    with pytest.raises(ValueError) as exc_info:
+        lookup()
+    assert "Version file must be provided" == str(exc_info.value)
@@ -20,13 +20,16 @@ def get_logger() -> Logger:
 
 
 def __create_logger() -> Logger:
+    version_logger = logging.getLogger("version_system")
+    if version_logger.handlers:
+        # already set up by an earlier import of this module
+        return version_logger
     formatter = logging.Formatter(
         fmt="%(asctime)s - %(levelname)s - %(module)s - %(message)s"
     )
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(logging.INFO)
     handler.setFormatter(formatter)
-    version_logger = logging.getLogger("version_system")
     version_logger.setLevel(logging.INFO)
     version_logger.addHandler(handler)
     return version_logger
@@ -58,7 +61,8 @@ def get_repo_branch(repo_path: str) -> str:
     result = subprocess.run(
         ["git", "-C", repo_path, "rev-parse", "--abbrev-ref", "HEAD"],
         capture_output=True,
-        text=True,
+        encoding="utf-8",
+        errors="replace",
     )
     if result.returncode == 0:
         return result.stdout.strip()